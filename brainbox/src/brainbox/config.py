@@ -8,6 +8,10 @@ from typing import Literal
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Resolved once at import: the package location never changes at runtime,
+# and resolve() costs a realpath syscall per call.
+_AGENTS_DIR = Path(__file__).resolve().parent.parent.parent / "agents"
+
 
 def _default_config_dir() -> Path:
     import os
@@ -209,7 +213,7 @@ class Settings(BaseSettings):
 
     @property
     def agents_dir(self) -> Path:
-        return Path(__file__).resolve().parent.parent.parent / "agents"
+        return _AGENTS_DIR
 
     @property
     def roles_dir(self) -> Path:
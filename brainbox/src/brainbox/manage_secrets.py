@@ -12,28 +12,30 @@ from rich.table import Table
 
 from .auth import write_secure_file
 from .config import settings
+from .secrets import _read_sa_token_file, get_sa_token
 
 console = Console()
 
+_VALID_KEY_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
 
 def _get_keys() -> list[str]:
     """List existing secret key names."""
-    secrets_dir = settings.secrets_dir
-    if not secrets_dir.is_dir():
+    try:
+        with os.scandir(settings.secrets_dir) as entries:
+            return sorted(e.name for e in entries if e.is_file())
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(f.name for f in secrets_dir.iterdir() if f.is_file())
 
 
 def _show_status() -> None:
     """Show 1Password configuration state, template entries, and plaintext files."""
     console.print()
 
-    # 1Password status
-    from .secrets import get_sa_token, has_op_integration
-
-    if has_op_integration():
-        token = get_sa_token()
-        masked = token[:8] + "..." if token and len(token) > 8 else "***"
+    # 1Password status (one token lookup serves both sections below)
+    token = get_sa_token()
+    if token is not None:
+        masked = token[:8] + "..." if len(token) > 8 else "***"
         console.print(f"[green]1Password:[/green] configured (token: {masked})")
 
         # Show token source
@@ -45,7 +47,7 @@ def _show_status() -> None:
         console.print("[yellow]1Password:[/yellow] not configured")
 
     # Vault info
-    if has_op_integration():
+    if token is not None:
         vault = settings.op_vault
         console.print(f"\n[dim]Vault: {vault or '(all accessible)'}[/dim]")
         console.print("[dim]Items discovered automatically from vault — no template needed.[/dim]")
@@ -118,6 +120,8 @@ def _setup_op() -> None:
     # Write token file
     token_file = settings.op_sa_token_file
     write_secure_file(token_file, token, mode=0o400)
+    # The read cache is keyed on mtime, which a same-tick rewrite can leave unchanged
+    _read_sa_token_file.cache_clear()
 
     console.print(f"\n[green]Saved to {token_file} (mode 0400)[/green]")
     console.print("[dim]Secrets will now be resolved from 1Password automatically.[/dim]\n")
@@ -163,7 +167,7 @@ def _add_key() -> None:
         "Name:",
         validate=lambda val: (
             True
-            if val and re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", val)
+            if val and _VALID_KEY_NAME.match(val)
             else "Use letters, numbers, and underscores only"
         ),
     ).ask()
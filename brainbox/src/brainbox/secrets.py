@@ -16,10 +16,19 @@ import json
 import os
 import re
 import subprocess
+from functools import lru_cache
+from pathlib import Path
 
 from .config import settings
 from .log import get_logger
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional speedup; stdlib json also accepts bytes
+    _json_loads = json.loads
+
 log = get_logger()
 
 # Fields to skip during vault discovery
@@ -35,36 +44,67 @@ def get_sa_token() -> str | None:
 
     token_file = settings.op_sa_token_file
     try:
-        return token_file.read_text().strip() or None
-    except (FileNotFoundError, PermissionError):
+        mtime_ns = token_file.stat().st_mtime_ns
+        return _read_sa_token_file(token_file, mtime_ns)
+    except OSError:
         return None
 
 
+@lru_cache(maxsize=4)
+def _read_sa_token_file(token_file: Path, mtime_ns: int) -> str | None:
+    """Read the token file; keyed on mtime so a rewritten file is re-read.
+
+    Read errors propagate and are not cached, so fixing the file's
+    permissions (which leaves mtime unchanged) takes effect on the next call.
+    """
+    return token_file.read_text().strip() or None
+
+
 def has_op_integration() -> bool:
     """Check whether 1Password integration is configured."""
     return get_sa_token() is not None
 
 
-def _op_run(args: list[str], sa_token: str) -> str:
+def _op_run(args: list[str], sa_token: str, stdin: bytes | None = None) -> bytes:
     """Run an ``op`` CLI command with SA token injected via environment.
 
+    Service Account tokens authenticate every invocation — there is no
+    ``op signin`` session to keep alive — so the way to cut ``op`` overhead is
+    fewer calls (batch via *stdin*), not a pooled process.
+
+    Returns raw stdout bytes so the JSON parser can skip a decode step.
+
     Security note: the SA token is visible in the subprocess env dict passed to
     ``subprocess.run``; callers must not log the return value or the env dict.
     """
     env = {**os.environ, "OP_SERVICE_ACCOUNT_TOKEN": sa_token}
     result = subprocess.run(
         ["op", *args],
+        input=stdin,
         capture_output=True,
-        text=True,
         timeout=30,
         env=env,
     )
     if result.returncode != 0:
-        stderr = result.stderr.strip()
+        stderr = result.stderr.decode(errors="replace").strip()
         raise RuntimeError(f"op {' '.join(args)} failed: {stderr}")
     return result.stdout
 
 
+def _iter_json_stream(raw: bytes | str):
+    """Yield each JSON value from concatenated output like ``op item get -``'s."""
+    text = raw.decode() if isinstance(raw, bytes) else raw
+    decoder = json.JSONDecoder()
+    pos = 0
+    while True:
+        while pos < len(text) and text[pos].isspace():
+            pos += 1
+        if pos == len(text):
+            return
+        value, pos = decoder.raw_decode(text, pos)
+        yield value
+
+
 def _to_env_name(item_title: str, field_label: str) -> str:
     """Derive an environment variable name from item title and field label.
 
@@ -97,26 +137,24 @@ def resolve_from_op(sa_token: str) -> dict[str, str]:
         log.error("secrets.op_list_failed", metadata={"error": str(exc)})
         raise
 
-    items = json.loads(raw)
+    items = _json_loads(raw)
     if not items:
         log.warning("secrets.vault_empty", metadata={"vault": settings.op_vault or "(all)"})
         return {}
 
-    resolved: dict[str, str] = {}
-    for item_summary in items:
-        item_id = item_summary["id"]
-        item_title = item_summary.get("title", item_id)
-
-        try:
-            raw = _op_run(["item", "get", item_id, "--format", "json"], sa_token)
-        except RuntimeError as exc:
-            log.error(
-                "secrets.op_get_failed",
-                metadata={"item": item_title, "error": str(exc)},
-            )
-            raise
+    # Fetch every item in one ``op item get -`` call: op reads the item list
+    # from stdin, so N items cost one process + session setup, not N.
+    item_refs = json.dumps([{"id": item["id"]} for item in items]).encode()
+    try:
+        raw = _op_run(["item", "get", "-", "--format", "json"], sa_token, stdin=item_refs)
+    except RuntimeError as exc:
+        log.error("secrets.op_get_failed", metadata={"items": len(items), "error": str(exc)})
+        raise
 
-        item = json.loads(raw)
+    resolved: dict[str, str] = {}
+    # op emits items in input order, so name collisions still resolve last-wins
+    for item in _iter_json_stream(raw):
+        item_title = item.get("title", item["id"])
 
         for field in item.get("fields", []):
             if field.get("id") in _SKIP_FIELD_IDS:
@@ -144,14 +182,32 @@ def resolve_from_op(sa_token: str) -> dict[str, str]:
     return resolved
 
 
+def _read_secret_file(path: str) -> str:
+    # Raw fd reads skip the TextIOWrapper setup open() does per file.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode().strip()
+
+
 def resolve_from_files() -> dict[str, str]:
     """Read secrets from plaintext files in secrets_dir (legacy fallback)."""
     secrets_dir = settings.secrets_dir
     resolved: dict[str, str] = {}
     try:
-        for f in secrets_dir.iterdir():
-            if f.is_file():
-                resolved[f.name] = f.read_text().strip()
+        with os.scandir(secrets_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                try:
+                    resolved[entry.name] = _read_secret_file(entry.path)
+                except FileNotFoundError:
+                    # Removed between the directory scan and the read
+                    continue
     except FileNotFoundError:
         pass
 
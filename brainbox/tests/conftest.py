@@ -1,6 +1,9 @@
 """Shared test fixtures."""
 
+from unittest.mock import MagicMock
+
 import pytest
+from docker.errors import NotFound
 
 
 @pytest.fixture(autouse=True)
@@ -21,3 +24,53 @@ def _override_api_key_auth():
         # If brainbox.api can't be imported (e.g., missing optional deps),
         # skip the override — tests that don't import app won't need it
         yield
+
+
+# Env vars consulted by the profile resolvers in brainbox.lifecycle
+_PROFILE_ENV_VARS = (
+    "WORKSPACE_PROFILE",
+    "WORKSPACE_HOME",
+    "TMPDIR",
+    "CLAUDE_CONFIG_DIR",
+    "AWS_CONFIG_FILE",
+    "AWS_SHARED_CREDENTIALS_FILE",
+    "AZURE_CONFIG_DIR",
+    "KUBECONFIG",
+    "GIT_CONFIG_GLOBAL",
+    "CLOUDSDK_CONFIG",
+    "TF_CLI_CONFIG_FILE",
+)
+
+
+@pytest.fixture()
+def clean_profile_env(monkeypatch):
+    """Unset every env var the profile resolvers read; restored on teardown."""
+    for key in _PROFILE_ENV_VARS:
+        monkeypatch.delenv(key, raising=False)
+
+
+@pytest.fixture()
+def default_profile_env(clean_profile_env, monkeypatch, tmp_path):
+    """Clean profile env with WORKSPACE_HOME pointing at tmp_path."""
+    monkeypatch.setenv("WORKSPACE_HOME", str(tmp_path))
+
+
+@pytest.fixture()
+def claude_dir(tmp_path, monkeypatch):
+    """An empty Claude config dir exported as CLAUDE_CONFIG_DIR."""
+    d = tmp_path / ".claude"
+    d.mkdir()
+    monkeypatch.setenv("CLAUDE_CONFIG_DIR", str(d))
+    return d
+
+
+@pytest.fixture()
+def provisioned_client():
+    """A mock Docker client ready for provision(): image present, no existing container."""
+    client = MagicMock()
+    image = MagicMock()
+    image.attrs = {"RepoDigests": []}
+    client.images.get.return_value = image
+    client.containers.get.side_effect = NotFound("not found")
+    client.containers.create.return_value = MagicMock()
+    yield client
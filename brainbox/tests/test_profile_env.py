@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 
+import docker
 import pytest
-from docker.errors import NotFound
+from docker.models.containers import Container
 
 from brainbox.config import ProfileSettings, Settings
 from brainbox.lifecycle import (
@@ -14,9 +16,13 @@ from brainbox.lifecycle import (
     _resolve_oauth_account,
     _resolve_profile_env,
     _resolve_profile_mounts,
+    provision,
+    start,
 )
 from brainbox.models import SessionContext
 
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
 
 # ---------------------------------------------------------------------------
 # ProfileSettings defaults
@@ -60,38 +66,34 @@ class TestProfileSettings:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture()
+def mock_lifecycle_settings():
+    """Patch lifecycle.settings with default ProfileSettings (tests may override .profile)."""
+    with patch("brainbox.lifecycle.settings") as mock_settings:
+        mock_settings.profile = ProfileSettings()
+        yield mock_settings
+
+
+@pytest.mark.usefixtures("default_profile_env", "mock_lifecycle_settings")
 class TestResolveProfileMounts:
     # --- AWS ---
 
     def test_mounts_default_aws_dir(self, tmp_path):
         aws_dir = tmp_path / ".aws"
         aws_dir.mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         assert str(aws_dir) in result
         assert result[str(aws_dir)]["bind"] == "/home/developer/.aws"
         assert result[str(aws_dir)]["mode"] == "ro"
 
-    def test_mounts_aws_from_env_var(self, tmp_path):
+    def test_mounts_aws_from_env_var(self, tmp_path, monkeypatch):
         aws_dir = tmp_path / "custom-aws"
         aws_dir.mkdir()
         config_file = aws_dir / "config"
         config_file.touch()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict(
-                "os.environ",
-                {"AWS_CONFIG_FILE": str(config_file), "WORKSPACE_HOME": str(tmp_path)},
-                clear=True,
-            ),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(config_file))
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         assert str(aws_dir) in result
         assert result[str(aws_dir)]["bind"] == "/home/developer/.aws"
@@ -101,30 +103,17 @@ class TestResolveProfileMounts:
     def test_mounts_default_azure_dir(self, tmp_path):
         azure_dir = tmp_path / ".azure"
         azure_dir.mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         assert str(azure_dir) in result
         assert result[str(azure_dir)]["bind"] == "/home/developer/.azure"
         assert result[str(azure_dir)]["mode"] == "ro"
 
-    def test_mounts_azure_from_env_var(self, tmp_path):
+    def test_mounts_azure_from_env_var(self, tmp_path, monkeypatch):
         azure_dir = tmp_path / "custom-azure"
         azure_dir.mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict(
-                "os.environ",
-                {"AZURE_CONFIG_DIR": str(azure_dir), "WORKSPACE_HOME": str(tmp_path)},
-                clear=True,
-            ),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        monkeypatch.setenv("AZURE_CONFIG_DIR", str(azure_dir))
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         assert str(azure_dir) in result
         assert result[str(azure_dir)]["bind"] == "/home/developer/.azure"
@@ -134,32 +123,19 @@ class TestResolveProfileMounts:
     def test_mounts_default_kube_dir(self, tmp_path):
         kube_dir = tmp_path / ".kube"
         kube_dir.mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         assert str(kube_dir) in result
         assert result[str(kube_dir)]["bind"] == "/home/developer/.kube"
         assert result[str(kube_dir)]["mode"] == "ro"
 
-    def test_mounts_kube_from_env_var(self, tmp_path):
+    def test_mounts_kube_from_env_var(self, tmp_path, monkeypatch):
         kube_dir = tmp_path / "custom-kube"
         kube_dir.mkdir()
         kubeconfig = kube_dir / "config"
         kubeconfig.touch()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict(
-                "os.environ",
-                {"KUBECONFIG": str(kubeconfig), "WORKSPACE_HOME": str(tmp_path)},
-                clear=True,
-            ),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        monkeypatch.setenv("KUBECONFIG", str(kubeconfig))
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         assert str(kube_dir) in result
         assert result[str(kube_dir)]["bind"] == "/home/developer/.kube"
@@ -169,25 +145,16 @@ class TestResolveProfileMounts:
     def test_mounts_ssh_dir(self, tmp_path):
         ssh_dir = tmp_path / ".ssh"
         ssh_dir.mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         assert str(ssh_dir) in result
         assert result[str(ssh_dir)]["bind"] == "/home/developer/.ssh"
         assert result[str(ssh_dir)]["mode"] == "ro"
 
-    def test_skips_ssh_when_disabled(self, tmp_path):
+    def test_skips_ssh_when_disabled(self, tmp_path, mock_lifecycle_settings):
         (tmp_path / ".ssh").mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings(mount_ssh=False)
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
+            mock_lifecycle_settings.profile = ProfileSettings(mount_ssh=False)
             result = _resolve_profile_mounts()
         binds = [v["bind"] for v in result.values()]
         assert "/home/developer/.ssh" not in binds
@@ -197,30 +164,17 @@ class TestResolveProfileMounts:
     def test_mounts_gitconfig_file(self, tmp_path):
         gitconfig = tmp_path / ".gitconfig"
         gitconfig.write_text("[user]\n    name = Test\n")
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         assert str(gitconfig) in result
         assert result[str(gitconfig)]["bind"] == "/home/developer/.gitconfig"
         assert result[str(gitconfig)]["mode"] == "rw"
 
-    def test_mounts_gitconfig_from_env_var(self, tmp_path):
+    def test_mounts_gitconfig_from_env_var(self, tmp_path, monkeypatch):
         custom_gitconfig = tmp_path / "custom.gitconfig"
         custom_gitconfig.write_text("[user]\n    name = Custom\n")
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict(
-                "os.environ",
-                {"GIT_CONFIG_GLOBAL": str(custom_gitconfig), "WORKSPACE_HOME": str(tmp_path)},
-                clear=True,
-            ),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(custom_gitconfig))
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         assert str(custom_gitconfig) in result
         assert result[str(custom_gitconfig)]["bind"] == "/home/developer/.gitconfig"
@@ -229,25 +183,16 @@ class TestResolveProfileMounts:
 
     def test_skips_gcloud_by_default(self, tmp_path):
         (tmp_path / ".gcloud").mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         binds = [v["bind"] for v in result.values()]
         assert "/home/developer/.gcloud" not in binds
 
-    def test_mounts_gcloud_when_enabled(self, tmp_path):
+    def test_mounts_gcloud_when_enabled(self, tmp_path, mock_lifecycle_settings):
         gcloud_dir = tmp_path / ".gcloud"
         gcloud_dir.mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings(mount_gcloud=True)
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
+            mock_lifecycle_settings.profile = ProfileSettings(mount_gcloud=True)
             result = _resolve_profile_mounts()
         assert str(gcloud_dir) in result
         assert result[str(gcloud_dir)]["bind"] == "/home/developer/.gcloud"
@@ -256,55 +201,38 @@ class TestResolveProfileMounts:
 
     def test_skips_terraform_by_default(self, tmp_path):
         (tmp_path / ".terraform.d").mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
             result = _resolve_profile_mounts()
         binds = [v["bind"] for v in result.values()]
         assert "/home/developer/.terraform.d" not in binds
 
-    def test_mounts_terraform_when_enabled(self, tmp_path):
+    def test_mounts_terraform_when_enabled(self, tmp_path, mock_lifecycle_settings):
         terraform_dir = tmp_path / ".terraform.d"
         terraform_dir.mkdir()
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings(mount_terraform=True)
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
+            mock_lifecycle_settings.profile = ProfileSettings(mount_terraform=True)
             result = _resolve_profile_mounts()
         assert str(terraform_dir) in result
         assert result[str(terraform_dir)]["bind"] == "/home/developer/.terraform.d"
 
     # --- Edge cases ---
 
-    def test_skips_missing_directories(self, tmp_path):
+    def test_skips_missing_directories(self, tmp_path, mock_lifecycle_settings):
         """No dirs exist → no mounts (except gitconfig which is a file check)."""
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings(mount_reflex=False)
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
+            mock_lifecycle_settings.profile = ProfileSettings(mount_reflex=False)
             result = _resolve_profile_mounts()
         assert result == {}
 
-    def test_skips_disabled_mounts(self, tmp_path):
+    def test_skips_disabled_mounts(self, tmp_path, mock_lifecycle_settings):
         """Dirs exist but settings disable them."""
         (tmp_path / ".aws").mkdir()
         (tmp_path / ".azure").mkdir()
         (tmp_path / ".kube").mkdir()
         (tmp_path / ".ssh").mkdir()
         (tmp_path / ".gitconfig").write_text("[user]\n    name = Test\n")
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
-            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings(
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path):
+            mock_lifecycle_settings.profile = ProfileSettings(
                 mount_aws=False,
                 mount_azure=False,
                 mount_kube=False,
@@ -317,7 +245,7 @@ class TestResolveProfileMounts:
 
     # --- Explicit workspace_home ---
 
-    def test_mounts_with_explicit_workspace_home(self, tmp_path):
+    def test_mounts_with_explicit_workspace_home(self, tmp_path, monkeypatch):
         """workspace_home + workspace_profile reads cache and resolves mounts."""
         ws = tmp_path / "firebuild"
         ws.mkdir()
@@ -333,23 +261,16 @@ class TestResolveProfileMounts:
             'GIT_CONFIG_GLOBAL="$WORKSPACE_HOME/.gitconfig"\n'
         )
 
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path / "wrong"),
-            patch.dict(
-                "os.environ",
-                {"WORKSPACE_HOME": str(tmp_path / "wrong"), "TMPDIR": str(tmp_path)},
-                clear=True,
-            ),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        monkeypatch.setenv("WORKSPACE_HOME", str(tmp_path / "wrong"))
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path / "wrong"):
             result = _resolve_profile_mounts(workspace_profile="firebuild", workspace_home=str(ws))
 
         assert str(ws / ".aws") in result
         assert str(ws / ".ssh") in result
         assert str(ws / ".gitconfig") in result
 
-    def test_workspace_home_reads_cache_env_vars(self, tmp_path):
+    def test_workspace_home_reads_cache_env_vars(self, tmp_path, monkeypatch):
         """When workspace_home + workspace_profile are provided, mounts resolve from cache."""
         ws = tmp_path / "firebuild"
         ws.mkdir()
@@ -364,27 +285,17 @@ class TestResolveProfileMounts:
         cache_dir.mkdir(parents=True)
         (cache_dir / ".env").write_text('AWS_CONFIG_FILE="$WORKSPACE_HOME/.aws/config"\n')
 
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path / "wrong"),
-            patch.dict(
-                "os.environ",
-                {
-                    "AWS_CONFIG_FILE": str(wrong_aws / "config"),
-                    "WORKSPACE_HOME": str(tmp_path / "wrong"),
-                    "TMPDIR": str(tmp_path),
-                },
-                clear=True,
-            ),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(wrong_aws / "config"))
+        monkeypatch.setenv("WORKSPACE_HOME", str(tmp_path / "wrong"))
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path / "wrong"):
             result = _resolve_profile_mounts(workspace_profile="firebuild", workspace_home=str(ws))
 
         # Cache-resolved path wins, NOT the API host's env var
         assert str(ws / ".aws") in result
         assert str(wrong_aws) not in result
 
-    def test_workspace_home_without_profile_uses_fallback(self, tmp_path):
+    def test_workspace_home_without_profile_uses_fallback(self, tmp_path, monkeypatch):
         """workspace_home without workspace_profile falls back to directory-based resolution."""
         ws = tmp_path / "firebuild"
         ws.mkdir()
@@ -394,19 +305,9 @@ class TestResolveProfileMounts:
         wrong_aws.mkdir()
         (wrong_aws / "config").touch()
 
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=tmp_path / "wrong"),
-            patch.dict(
-                "os.environ",
-                {
-                    "AWS_CONFIG_FILE": str(wrong_aws / "config"),
-                    "WORKSPACE_HOME": str(tmp_path / "wrong"),
-                },
-                clear=True,
-            ),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        monkeypatch.setenv("AWS_CONFIG_FILE", str(wrong_aws / "config"))
+        monkeypatch.setenv("WORKSPACE_HOME", str(tmp_path / "wrong"))
+        with patch("brainbox.lifecycle.Path.home", return_value=tmp_path / "wrong"):
             result = _resolve_profile_mounts(workspace_home=str(ws))
 
         # No cache → env vars empty → falls back to directory
@@ -423,12 +324,7 @@ class TestResolveProfileMounts:
         sso_cache.mkdir(parents=True)
         (sso_cache / "token.json").write_text("{}")
 
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=real_home),
-            patch.dict("os.environ", {}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        with patch("brainbox.lifecycle.Path.home", return_value=real_home):
             result = _resolve_profile_mounts(workspace_home=str(ws))
 
         # Profile .aws is mounted
@@ -437,17 +333,13 @@ class TestResolveProfileMounts:
         assert str(sso_cache) in result
         assert result[str(sso_cache)]["bind"] == "/home/developer/.aws/sso/cache"
 
-    def test_no_sso_overlay_without_workspace_home(self, tmp_path):
+    def test_no_sso_overlay_without_workspace_home(self, tmp_path, monkeypatch):
         """Without workspace_home, no extra SSO cache mount is added."""
         home = tmp_path / "home"
         (home / ".aws" / "sso" / "cache").mkdir(parents=True)
 
-        with (
-            patch("brainbox.lifecycle.Path.home", return_value=home),
-            patch.dict("os.environ", {"WORKSPACE_HOME": ""}, clear=True),
-            patch("brainbox.lifecycle.settings") as mock_settings,
-        ):
-            mock_settings.profile = ProfileSettings()
+        monkeypatch.setenv("WORKSPACE_HOME", "")
+        with patch("brainbox.lifecycle.Path.home", return_value=home):
             result = _resolve_profile_mounts()
 
         # .aws is mounted from home, SSO cache is already inside it — no overlay
@@ -461,7 +353,9 @@ class TestResolveProfileMounts:
 
 
 class TestReadCacheVars:
-    def test_expands_workspace_home_and_strips_quotes(self, tmp_path):
+    def test_expands_workspace_home_and_strips_quotes(
+        self, tmp_path, clean_profile_env, monkeypatch
+    ):
         cache_dir = tmp_path / "sp-profiles" / "testprofile"
         cache_dir.mkdir(parents=True)
         (cache_dir / ".env").write_text(
@@ -469,32 +363,32 @@ class TestReadCacheVars:
             "AZURE_CONFIG_DIR='$WORKSPACE_HOME/.azure'\n"
             "KUBECONFIG=$WORKSPACE_HOME/.kube/config\n"
         )
-        with patch.dict("os.environ", {"TMPDIR": str(tmp_path)}, clear=True):
-            result = _read_cache_vars("testprofile", "/host/ws")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _read_cache_vars("testprofile", "/host/ws")
 
         assert result["AWS_CONFIG_FILE"] == "/host/ws/.aws/config"
         assert result["AZURE_CONFIG_DIR"] == "/host/ws/.azure"
         assert result["KUBECONFIG"] == "/host/ws/.kube/config"
 
-    def test_returns_empty_when_no_cache(self, tmp_path):
-        with patch.dict("os.environ", {"TMPDIR": str(tmp_path)}, clear=True):
-            result = _read_cache_vars("nonexistent", "/host/ws")
+    def test_returns_empty_when_no_cache(self, tmp_path, clean_profile_env, monkeypatch):
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _read_cache_vars("nonexistent", "/host/ws")
         assert result == {}
 
-    def test_skips_comments_and_blank_lines(self, tmp_path):
+    def test_skips_comments_and_blank_lines(self, tmp_path, clean_profile_env, monkeypatch):
         cache_dir = tmp_path / "sp-profiles" / "prof"
         cache_dir.mkdir(parents=True)
         (cache_dir / ".env").write_text("# comment\n\n  \nREAL_VAR=value\n")
-        with patch.dict("os.environ", {"TMPDIR": str(tmp_path)}, clear=True):
-            result = _read_cache_vars("prof", "/host/ws")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _read_cache_vars("prof", "/host/ws")
         assert result == {"REAL_VAR": "value"}
 
-    def test_handles_export_prefix(self, tmp_path):
+    def test_handles_export_prefix(self, tmp_path, clean_profile_env, monkeypatch):
         cache_dir = tmp_path / "sp-profiles" / "prof"
         cache_dir.mkdir(parents=True)
         (cache_dir / ".env").write_text('export MY_VAR="hello"\n')
-        with patch.dict("os.environ", {"TMPDIR": str(tmp_path)}, clear=True):
-            result = _read_cache_vars("prof", "/host/ws")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _read_cache_vars("prof", "/host/ws")
         assert result == {"MY_VAR": "hello"}
 
 
@@ -504,33 +398,27 @@ class TestReadCacheVars:
 
 
 class TestResolveProfileEnv:
-    def test_returns_none_without_workspace_profile(self):
-        with patch.dict("os.environ", {"WORKSPACE_PROFILE": ""}, clear=True):
-            result = _resolve_profile_env()
+    def test_returns_none_without_workspace_profile(self, clean_profile_env, monkeypatch):
+        monkeypatch.setenv("WORKSPACE_PROFILE", "")
+        result = _resolve_profile_env()
         assert result is None
 
-    def test_returns_none_when_cache_missing(self, tmp_path):
-        with patch.dict(
-            "os.environ",
-            {"WORKSPACE_PROFILE": "personal", "TMPDIR": str(tmp_path)},
-            clear=True,
-        ):
-            result = _resolve_profile_env()
+    def test_returns_none_when_cache_missing(self, tmp_path, clean_profile_env, monkeypatch):
+        monkeypatch.setenv("WORKSPACE_PROFILE", "personal")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _resolve_profile_env()
         assert result is None
 
-    def test_reads_cached_env_and_prepends_identity(self, tmp_path):
+    def test_reads_cached_env_and_prepends_identity(self, tmp_path, clean_profile_env, monkeypatch):
         cache_dir = tmp_path / "sp-profiles" / "personal"
         cache_dir.mkdir(parents=True)
         env_file = cache_dir / ".env"
         env_file.write_text(
             '# A comment\nANTHROPIC_API_KEY="sk-test"\nQDRANT_URL=http://localhost:6333\n'
         )
-        with patch.dict(
-            "os.environ",
-            {"WORKSPACE_PROFILE": "personal", "TMPDIR": str(tmp_path)},
-            clear=True,
-        ):
-            result = _resolve_profile_env()
+        monkeypatch.setenv("WORKSPACE_PROFILE", "personal")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _resolve_profile_env()
 
         assert result is not None
         lines = result.splitlines()
@@ -539,7 +427,7 @@ class TestResolveProfileEnv:
         assert 'ANTHROPIC_API_KEY="sk-test"' in result
         assert "QDRANT_URL=http://localhost:6333" in result
 
-    def test_strips_host_only_vars(self, tmp_path):
+    def test_strips_host_only_vars(self, tmp_path, clean_profile_env, monkeypatch):
         cache_dir = tmp_path / "sp-profiles" / "personal"
         cache_dir.mkdir(parents=True)
         env_file = cache_dir / ".env"
@@ -548,29 +436,23 @@ class TestResolveProfileEnv:
             'GIT_SSH_COMMAND="ssh -F /host/path"\n'
             "GOOD_VAR=keep_me\n"
         )
-        with patch.dict(
-            "os.environ",
-            {"WORKSPACE_PROFILE": "personal", "TMPDIR": str(tmp_path)},
-            clear=True,
-        ):
-            result = _resolve_profile_env()
+        monkeypatch.setenv("WORKSPACE_PROFILE", "personal")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _resolve_profile_env()
 
         assert result is not None
         assert "SSH_AUTH_SOCK" not in result
         assert "GIT_SSH_COMMAND" not in result
         assert "GOOD_VAR=keep_me" in result
 
-    def test_skips_comments_and_blank_lines(self, tmp_path):
+    def test_skips_comments_and_blank_lines(self, tmp_path, clean_profile_env, monkeypatch):
         cache_dir = tmp_path / "sp-profiles" / "test"
         cache_dir.mkdir(parents=True)
         env_file = cache_dir / ".env"
         env_file.write_text("# This is a comment\n\n  \nREAL_VAR=value\n")
-        with patch.dict(
-            "os.environ",
-            {"WORKSPACE_PROFILE": "test", "TMPDIR": str(tmp_path)},
-            clear=True,
-        ):
-            result = _resolve_profile_env()
+        monkeypatch.setenv("WORKSPACE_PROFILE", "test")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _resolve_profile_env()
 
         assert result is not None
         # Only identity lines + REAL_VAR
@@ -578,7 +460,7 @@ class TestResolveProfileEnv:
         assert len(lines) == 3
         assert lines[2] == "REAL_VAR=value"
 
-    def test_strips_claude_config_dir(self, tmp_path):
+    def test_strips_claude_config_dir(self, tmp_path, clean_profile_env, monkeypatch):
         cache_dir = tmp_path / "sp-profiles" / "personal"
         cache_dir.mkdir(parents=True)
         env_file = cache_dir / ".env"
@@ -587,29 +469,23 @@ class TestResolveProfileEnv:
             "GEMINI_CONFIG_DIR=$WORKSPACE_HOME/.config/gemini\n"
             "GOOD_VAR=keep\n"
         )
-        with patch.dict(
-            "os.environ",
-            {"WORKSPACE_PROFILE": "personal", "TMPDIR": str(tmp_path)},
-            clear=True,
-        ):
-            result = _resolve_profile_env()
+        monkeypatch.setenv("WORKSPACE_PROFILE", "personal")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _resolve_profile_env()
 
         assert result is not None
         assert "CLAUDE_CONFIG_DIR" not in result
         assert "GEMINI_CONFIG_DIR" not in result
         assert "GOOD_VAR=keep" in result
 
-    def test_handles_export_prefix(self, tmp_path):
+    def test_handles_export_prefix(self, tmp_path, clean_profile_env, monkeypatch):
         cache_dir = tmp_path / "sp-profiles" / "work"
         cache_dir.mkdir(parents=True)
         env_file = cache_dir / ".env"
         env_file.write_text("export HOME=/bad\nexport MY_VAR=good\n")
-        with patch.dict(
-            "os.environ",
-            {"WORKSPACE_PROFILE": "work", "TMPDIR": str(tmp_path)},
-            clear=True,
-        ):
-            result = _resolve_profile_env()
+        monkeypatch.setenv("WORKSPACE_PROFILE", "work")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _resolve_profile_env()
 
         assert result is not None
         # HOME=/bad should be stripped, but WORKSPACE_HOME is prepended
@@ -620,37 +496,31 @@ class TestResolveProfileEnv:
 
     # --- Explicit workspace_profile ---
 
-    def test_reads_env_with_explicit_profile(self, tmp_path):
+    def test_reads_env_with_explicit_profile(self, tmp_path, clean_profile_env, monkeypatch):
         """workspace_profile param overrides WORKSPACE_PROFILE env var."""
         cache_dir = tmp_path / "sp-profiles" / "firebuild"
         cache_dir.mkdir(parents=True)
         (cache_dir / ".env").write_text('SOME_KEY="value"\n')
 
-        with patch.dict(
-            "os.environ",
-            {"WORKSPACE_PROFILE": "personal", "TMPDIR": str(tmp_path)},
-            clear=True,
-        ):
-            result = _resolve_profile_env(workspace_profile="firebuild")
+        monkeypatch.setenv("WORKSPACE_PROFILE", "personal")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _resolve_profile_env(workspace_profile="firebuild")
 
         assert result is not None
         lines = result.splitlines()
         assert lines[0] == "WORKSPACE_PROFILE=firebuild"
         assert 'SOME_KEY="value"' in result
 
-    def test_explicit_profile_ignores_env_var(self, tmp_path):
+    def test_explicit_profile_ignores_env_var(self, tmp_path, clean_profile_env, monkeypatch):
         """When workspace_profile is passed, the env var WORKSPACE_PROFILE is not used."""
         # Only set up cache for firebuild, not personal
         cache_dir = tmp_path / "sp-profiles" / "firebuild"
         cache_dir.mkdir(parents=True)
         (cache_dir / ".env").write_text("KEY=val\n")
 
-        with patch.dict(
-            "os.environ",
-            {"WORKSPACE_PROFILE": "personal", "TMPDIR": str(tmp_path)},
-            clear=True,
-        ):
-            result = _resolve_profile_env(workspace_profile="firebuild")
+        monkeypatch.setenv("WORKSPACE_PROFILE", "personal")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        result = _resolve_profile_env(workspace_profile="firebuild")
 
         assert result is not None
         assert "WORKSPACE_PROFILE=firebuild" in result
@@ -661,51 +531,37 @@ class TestResolveProfileEnv:
 # ---------------------------------------------------------------------------
 
 
+_CLAUDE_JSON_VALID = (
+    b'{"oauthAccount": {"accountUuid": "abc-123", "emailAddress": "test@example.com",'
+    b' "organizationUuid": "org-456"}}'
+)
+_CLAUDE_JSON_NO_OAUTH = b'{"hasCompletedOnboarding": true}'
+_CLAUDE_JSON_MALFORMED = b"not valid json"
+_CLAUDE_JSON_NO_UUID = b'{"oauthAccount": {"emailAddress": "test@example.com"}}'
+
+
 class TestResolveOauthAccount:
-    def test_reads_oauth_account_from_host(self, tmp_path):
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        claude_json = claude_dir / ".claude.json"
-        claude_json.write_text(
-            '{"oauthAccount": {"accountUuid": "abc-123", "emailAddress": "test@example.com", "organizationUuid": "org-456"}}'
-        )
-        with patch.dict("os.environ", {"CLAUDE_CONFIG_DIR": str(claude_dir)}, clear=False):
-            result = _resolve_oauth_account()
+    def test_reads_oauth_account_from_host(self, claude_dir):
+        (claude_dir / ".claude.json").write_bytes(_CLAUDE_JSON_VALID)
+        result = _resolve_oauth_account()
         assert result is not None
         assert result["accountUuid"] == "abc-123"
         assert result["emailAddress"] == "test@example.com"
 
-    def test_returns_none_when_no_config_file(self, tmp_path):
-        with patch.dict("os.environ", {"CLAUDE_CONFIG_DIR": str(tmp_path)}, clear=False):
-            result = _resolve_oauth_account()
-        assert result is None
-
-    def test_returns_none_when_no_oauth_account(self, tmp_path):
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        claude_json = claude_dir / ".claude.json"
-        claude_json.write_text('{"hasCompletedOnboarding": true}')
-        with patch.dict("os.environ", {"CLAUDE_CONFIG_DIR": str(claude_dir)}, clear=False):
-            result = _resolve_oauth_account()
-        assert result is None
+    def test_returns_none_when_no_config_file(self, claude_dir):
+        assert _resolve_oauth_account() is None
 
-    def test_returns_none_on_malformed_json(self, tmp_path):
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        claude_json = claude_dir / ".claude.json"
-        claude_json.write_text("not valid json")
-        with patch.dict("os.environ", {"CLAUDE_CONFIG_DIR": str(claude_dir)}, clear=False):
-            result = _resolve_oauth_account()
-        assert result is None
-
-    def test_returns_none_when_oauth_missing_account_uuid(self, tmp_path):
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
-        claude_json = claude_dir / ".claude.json"
-        claude_json.write_text('{"oauthAccount": {"emailAddress": "test@example.com"}}')
-        with patch.dict("os.environ", {"CLAUDE_CONFIG_DIR": str(claude_dir)}, clear=False):
-            result = _resolve_oauth_account()
-        assert result is None
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(_CLAUDE_JSON_NO_OAUTH, id="no-oauth-account"),
+            pytest.param(_CLAUDE_JSON_MALFORMED, id="malformed-json"),
+            pytest.param(_CLAUDE_JSON_NO_UUID, id="missing-account-uuid"),
+        ],
+    )
+    def test_returns_none_for_unusable_config(self, claude_dir, payload):
+        (claude_dir / ".claude.json").write_bytes(payload)
+        assert _resolve_oauth_account() is None
 
 
 # ---------------------------------------------------------------------------
@@ -714,38 +570,29 @@ class TestResolveOauthAccount:
 
 
 class TestProvisionProfileMounts:
-    @pytest.mark.asyncio
-    async def test_provision_includes_profile_volumes(self, tmp_path):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_provision_includes_profile_volumes(self, tmp_path, provisioned_client):
         aws_dir = tmp_path / ".aws"
         aws_dir.mkdir()
         ssh_dir = tmp_path / ".ssh"
         ssh_dir.mkdir()
 
-        mock_client = MagicMock()
-        mock_image = MagicMock()
-        mock_image.attrs = {"RepoDigests": []}
-        mock_client.images.get.return_value = mock_image
-        mock_client.containers.get.side_effect = NotFound("not found")
-        mock_client.containers.create.return_value = MagicMock()
-
         profile_mounts = {
             str(aws_dir): {"bind": "/home/developer/.aws", "mode": "ro"},
             str(ssh_dir): {"bind": "/home/developer/.ssh", "mode": "ro"},
         }
 
         with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
+            patch("brainbox.lifecycle._docker", return_value=provisioned_client),
+            patch("brainbox.backends.docker._docker", return_value=provisioned_client),
             patch("brainbox.lifecycle._find_available_port", return_value=7681),
             patch("brainbox.lifecycle._verify_cosign", new_callable=AsyncMock),
             patch("brainbox.lifecycle._resolve_profile_mounts", return_value=profile_mounts),
         ):
-            from brainbox.lifecycle import provision
-
             ctx = await provision(session_name="profile-test")
 
-        create_call = mock_client.containers.create.call_args
-        volumes = create_call[1]["volumes"]
+        create_call = provisioned_client.containers.create.call_args
+        volumes = create_call.kwargs["volumes"]
         assert str(aws_dir) in volumes
         assert volumes[str(aws_dir)]["bind"] == "/home/developer/.aws"
         assert volumes[str(aws_dir)]["mode"] == "ro"
@@ -753,73 +600,33 @@ class TestProvisionProfileMounts:
         assert "aws" in ctx.profile_mounts
         assert "ssh" in ctx.profile_mounts
 
-    @pytest.mark.asyncio
-    async def test_provision_sets_workspace_profile_label(self):
-        mock_client = MagicMock()
-        mock_image = MagicMock()
-        mock_image.attrs = {"RepoDigests": []}
-        mock_client.images.get.return_value = mock_image
-        mock_client.containers.get.side_effect = NotFound("not found")
-        mock_client.containers.create.return_value = MagicMock()
-
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_provision_sets_workspace_profile_label(self, provisioned_client, monkeypatch):
+        monkeypatch.setenv("WORKSPACE_PROFILE", "personal")
         with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
+            patch("brainbox.lifecycle._docker", return_value=provisioned_client),
+            patch("brainbox.backends.docker._docker", return_value=provisioned_client),
             patch("brainbox.lifecycle._find_available_port", return_value=7681),
             patch("brainbox.lifecycle._verify_cosign", new_callable=AsyncMock),
             patch("brainbox.lifecycle._resolve_profile_mounts", return_value={}),
-            patch.dict("os.environ", {"WORKSPACE_PROFILE": "personal"}, clear=False),
         ):
-            from brainbox.lifecycle import provision
-
             await provision(session_name="label-wp-test")
 
-        create_call = mock_client.containers.create.call_args
-        labels = create_call[1]["labels"]
+        create_call = provisioned_client.containers.create.call_args
+        labels = create_call.kwargs["labels"]
         assert labels["brainbox.workspace_profile"] == "PERSONAL"
 
-    @pytest.mark.asyncio
-    async def test_provision_no_mounts_when_dirs_missing(self):
-        mock_client = MagicMock()
-        mock_image = MagicMock()
-        mock_image.attrs = {"RepoDigests": []}
-        mock_client.images.get.return_value = mock_image
-        mock_client.containers.get.side_effect = NotFound("not found")
-        mock_client.containers.create.return_value = MagicMock()
-
-        with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
-            patch("brainbox.lifecycle._find_available_port", return_value=7681),
-            patch("brainbox.lifecycle._verify_cosign", new_callable=AsyncMock),
-            patch("brainbox.lifecycle._resolve_profile_mounts", return_value={}),
-        ):
-            from brainbox.lifecycle import provision
-
-            ctx = await provision(session_name="no-mount-test")
-
-        assert ctx.profile_mounts == set()
-
-    @pytest.mark.asyncio
-    async def test_provision_passes_workspace_home_to_mounts(self):
-        """workspace_profile and workspace_home are threaded to _resolve_profile_mounts()."""
-        mock_client = MagicMock()
-        mock_image = MagicMock()
-        mock_image.attrs = {"RepoDigests": []}
-        mock_client.images.get.return_value = mock_image
-        mock_client.containers.get.side_effect = NotFound("not found")
-        mock_client.containers.create.return_value = MagicMock()
-
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_provision_threads_workspace_fields(self, provisioned_client):
+        """workspace_profile/home reach _resolve_profile_mounts() and the SessionContext."""
         with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
+            patch("brainbox.lifecycle._docker", return_value=provisioned_client),
+            patch("brainbox.backends.docker._docker", return_value=provisioned_client),
             patch("brainbox.lifecycle._find_available_port", return_value=7681),
             patch("brainbox.lifecycle._verify_cosign", new_callable=AsyncMock),
             patch("brainbox.lifecycle._resolve_profile_mounts", return_value={}) as mock_mounts,
         ):
-            from brainbox.lifecycle import provision
-
-            await provision(
+            ctx = await provision(
                 session_name="ws-home-test",
                 workspace_profile="firebuild",
                 workspace_home="/Users/test/profiles/firebuild",
@@ -829,32 +636,8 @@ class TestProvisionProfileMounts:
             workspace_profile="firebuild",
             workspace_home="/Users/test/profiles/firebuild",
         )
-
-    @pytest.mark.asyncio
-    async def test_provision_stores_workspace_fields_on_ctx(self):
-        """workspace_profile and workspace_home are stored on SessionContext."""
-        mock_client = MagicMock()
-        mock_image = MagicMock()
-        mock_image.attrs = {"RepoDigests": []}
-        mock_client.images.get.return_value = mock_image
-        mock_client.containers.get.side_effect = NotFound("not found")
-        mock_client.containers.create.return_value = MagicMock()
-
-        with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
-            patch("brainbox.lifecycle._find_available_port", return_value=7681),
-            patch("brainbox.lifecycle._verify_cosign", new_callable=AsyncMock),
-            patch("brainbox.lifecycle._resolve_profile_mounts", return_value={}),
-        ):
-            from brainbox.lifecycle import provision
-
-            ctx = await provision(
-                session_name="ctx-fields-test",
-                workspace_profile="firebuild",
-                workspace_home="/Users/test/profiles/firebuild",
-            )
-
+        # No resolved dirs → no profile mounts recorded
+        assert ctx.profile_mounts == set()
         assert ctx.workspace_profile == "firebuild"
         assert ctx.workspace_home == "/Users/test/profiles/firebuild"
 
@@ -864,89 +647,107 @@ class TestProvisionProfileMounts:
 # ---------------------------------------------------------------------------
 
 
+# Built once; fixtures hand out copies because start() mutates ctx.state.
+_CTX_WITH_PROFILE = SessionContext(
+    session_name="profile-env-test",
+    container_name="developer-profile-env-test",
+    port=7681,
+    created_at=0,
+    ttl=3600,
+    hardened=False,
+    profile_mounts={"aws", "ssh", "gitconfig"},
+)
+_CTX_WITHOUT_PROFILE = SessionContext(
+    session_name="no-profile-env-test",
+    container_name="developer-no-profile-env-test",
+    port=7682,
+    created_at=0,
+    ttl=3600,
+    hardened=False,
+    profile_mounts=set(),
+)
+
+
+@pytest.fixture()
+def docker_mocks():
+    """Autospecced client/container pair; exec_run succeeds with no output."""
+    container = create_autospec(Container, instance=True)
+    container.exec_run.return_value = (0, b"")
+    client = create_autospec(docker.DockerClient, instance=True)
+    client.containers.get.return_value = container
+    return SimpleNamespace(client=client, container=container)
+
+
+@pytest.fixture()
+def patch_start(docker_mocks):
+    """Return a callable that patches lifecycle/backend for one ``start(ctx)``.
+
+    The callable returns the ``_resolve_profile_env`` mock so tests can assert
+    on how it was called.
+    """
+    with ExitStack() as stack:
+
+        def _patch(ctx, profile_env=None):
+            resolve_env = MagicMock(return_value=profile_env)
+            stack.enter_context(
+                patch.multiple(
+                    "brainbox.lifecycle",
+                    _docker=MagicMock(return_value=docker_mocks.client),
+                    _sessions={ctx.session_name: ctx},
+                    _resolve_profile_env=resolve_env,
+                )
+            )
+            stack.enter_context(
+                patch("brainbox.backends.docker._docker", return_value=docker_mocks.client)
+            )
+            return resolve_env
+
+        yield _patch
+
+
 class TestStartProfileEnv:
     @pytest.fixture()
     def ctx_with_profile(self):
-        return SessionContext(
-            session_name="profile-env-test",
-            container_name="developer-profile-env-test",
-            port=7681,
-            created_at=0,
-            ttl=3600,
-            hardened=False,
-            profile_mounts={"aws", "ssh", "gitconfig"},
-        )
+        return _CTX_WITH_PROFILE.model_copy(deep=True)
 
     @pytest.fixture()
     def ctx_without_profile(self):
-        return SessionContext(
-            session_name="no-profile-env-test",
-            container_name="developer-no-profile-env-test",
-            port=7682,
-            created_at=0,
-            ttl=3600,
-            hardened=False,
-            profile_mounts=set(),
-        )
-
-    @pytest.mark.asyncio
-    async def test_writes_profile_env_file(self, ctx_with_profile):
-        mock_client = MagicMock()
-        mock_container = MagicMock()
-        mock_container.exec_run.return_value = (0, b"")
-        mock_client.containers.get.return_value = mock_container
+        return _CTX_WITHOUT_PROFILE.model_copy(deep=True)
 
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_writes_profile_env_file(self, ctx_with_profile, docker_mocks, patch_start):
         profile_env_content = (
             'WORKSPACE_PROFILE=testing\nWORKSPACE_HOME=/home/developer\nANTHROPIC_API_KEY="sk-test"'
         )
+        patch_start(ctx_with_profile, profile_env=profile_env_content)
 
-        sessions = {ctx_with_profile.session_name: ctx_with_profile}
-        with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
-            patch("brainbox.lifecycle._sessions", sessions),
-            patch("brainbox.lifecycle._resolve_profile_env", return_value=profile_env_content),
-        ):
-            from brainbox.lifecycle import start
-
-            await start(ctx_with_profile)
+        await start(ctx_with_profile)
 
-        calls = mock_container.exec_run.call_args_list
-        profile_env_calls = [
-            c
-            for c in calls
-            if any("/run/profile/.env" in str(arg) for arg in c.args + tuple(c.kwargs.values()))
+        # Render each call once and search the rendered strings below.
+        rendered = [
+            " ".join(map(str, (*c.args, *c.kwargs.values())))
+            for c in docker_mocks.container.exec_run.call_args_list
         ]
+        profile_env_calls = [s for s in rendered if "/run/profile/.env" in s]
         # Expect: write file, source from .bashrc, source from .env
         assert len(profile_env_calls) >= 3
         # First call writes the file
-        cmd_str = str(profile_env_calls[0])
-        assert "WORKSPACE_PROFILE=testing" in cmd_str
+        assert "WORKSPACE_PROFILE=testing" in profile_env_calls[0]
         # Subsequent calls hook it into .bashrc and .env
-        hook_strs = " ".join(str(c) for c in profile_env_calls[1:])
+        hook_strs = " ".join(profile_env_calls[1:])
         assert "set -a" in hook_strs
         assert ".bashrc" in hook_strs
         assert ".env" in hook_strs
 
-    @pytest.mark.asyncio
-    async def test_skips_profile_env_when_no_cache(self, ctx_without_profile):
-        mock_client = MagicMock()
-        mock_container = MagicMock()
-        mock_container.exec_run.return_value = (0, b"")
-        mock_client.containers.get.return_value = mock_container
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_skips_profile_env_when_no_cache(
+        self, ctx_without_profile, docker_mocks, patch_start
+    ):
+        patch_start(ctx_without_profile)
 
-        sessions = {ctx_without_profile.session_name: ctx_without_profile}
-        with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
-            patch("brainbox.lifecycle._sessions", sessions),
-            patch("brainbox.lifecycle._resolve_profile_env", return_value=None),
-        ):
-            from brainbox.lifecycle import start
+        await start(ctx_without_profile)
 
-            await start(ctx_without_profile)
-
-        calls = mock_container.exec_run.call_args_list
+        calls = docker_mocks.container.exec_run.call_args_list
         profile_env_calls = [
             c
             for c in calls
@@ -954,8 +755,8 @@ class TestStartProfileEnv:
         ]
         assert len(profile_env_calls) == 0
 
-    @pytest.mark.asyncio
-    async def test_start_passes_workspace_profile_to_resolve(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_start_passes_workspace_profile_to_resolve(self, patch_start):
         """start() threads ctx.workspace_profile to _resolve_profile_env()."""
         ctx = SessionContext(
             session_name="wp-thread-test",
@@ -966,21 +767,8 @@ class TestStartProfileEnv:
             hardened=False,
             workspace_profile="firebuild",
         )
+        mock_env = patch_start(ctx)
 
-        mock_client = MagicMock()
-        mock_container = MagicMock()
-        mock_container.exec_run.return_value = (0, b"")
-        mock_client.containers.get.return_value = mock_container
-
-        sessions = {ctx.session_name: ctx}
-        with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
-            patch("brainbox.lifecycle._sessions", sessions),
-            patch("brainbox.lifecycle._resolve_profile_env", return_value=None) as mock_env,
-        ):
-            from brainbox.lifecycle import start
-
-            await start(ctx)
+        await start(ctx)
 
         mock_env.assert_called_once_with(workspace_profile="firebuild", workspace_home=None)
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from brainbox.config import settings
+from brainbox.manage_secrets import _setup_op
 from brainbox.secrets import (
+    _read_secret_file,
     _to_env_name,
     get_sa_token,
     has_op_integration,
@@ -88,6 +91,51 @@ class TestGetSaToken:
 
         assert get_sa_token() is None
 
+    def test_rereads_file_after_rewrite(self, isolated_config):
+        token_file = isolated_config / ".op-sa-token"
+        token_file.write_text("old-token")
+        assert get_sa_token() == "old-token"
+
+        token_file.write_text("new-token")
+        st = token_file.stat()
+        os.utime(token_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert get_sa_token() == "new-token"
+
+    def test_read_failure_is_not_cached(self, isolated_config):
+        token_file = isolated_config / ".op-sa-token"
+        token_file.write_text("file-token")
+
+        with patch.object(Path, "read_text", side_effect=PermissionError("denied")):
+            assert get_sa_token() is None
+
+        # Permissions fixed; mtime is unchanged but the token is now readable
+        assert get_sa_token() == "file-token"
+
+    def test_setup_op_rewrite_with_same_mtime(self, isolated_config):
+        token_file = isolated_config / ".op-sa-token"
+        token_file.write_text("old-token")
+        assert get_sa_token() == "old-token"
+        st = token_file.stat()
+
+        def write_pinned(path, content, mode=0o600):
+            # Coarse-mtime filesystem: the rewrite lands in the same tick
+            path.write_text(content)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        password = MagicMock()
+        password.ask.return_value = "new-token"
+        whoami = MagicMock(returncode=0, stdout="user@example.com", stderr="")
+        with (
+            patch("brainbox.manage_secrets.questionary.password", return_value=password),
+            patch("brainbox.manage_secrets.subprocess.run", return_value=whoami),
+            patch("brainbox.manage_secrets.write_secure_file", side_effect=write_pinned),
+        ):
+            _setup_op()
+
+        assert token_file.stat().st_mtime_ns == st.st_mtime_ns
+        assert get_sa_token() == "new-token"
+
     def test_has_op_integration_true(self, isolated_config, monkeypatch):
         monkeypatch.setenv("OP_SERVICE_ACCOUNT_TOKEN", "tok")
         assert has_op_integration() is True
@@ -128,6 +176,20 @@ class TestResolveFromFiles:
 
         assert resolve_from_files() == {"GOOD": "value"}
 
+    def test_skips_file_removed_before_read(self, isolated_config):
+        secrets_dir = isolated_config / ".secrets"
+        secrets_dir.mkdir()
+        (secrets_dir / "GOOD").write_text("value")
+        (secrets_dir / "GONE").write_text("stale")
+
+        def _read(path: str) -> str:
+            if path.endswith("GONE"):
+                os.unlink(path)
+            return _read_secret_file(path)
+
+        with patch("brainbox.secrets._read_secret_file", side_effect=_read):
+            assert resolve_from_files() == {"GOOD": "value"}
+
 
 # ---------------------------------------------------------------------------
 # resolve_from_op (mocked op CLI)
@@ -137,12 +199,13 @@ class TestResolveFromFiles:
 def _mock_op_run_factory(items_list: list[dict], items_detail: dict[str, dict]):
     """Return a mock _op_run that returns canned JSON for list and get."""
 
-    def _mock(args: list[str], sa_token: str) -> str:
+    def _mock(args: list[str], sa_token: str, stdin: bytes | None = None) -> str:
         if args[:2] == ["item", "list"]:
             return json.dumps(items_list)
-        if args[:2] == ["item", "get"]:
-            item_id = args[2]
-            return json.dumps(items_detail[item_id])
+        if args[:3] == ["item", "get", "-"]:
+            # op prints one pretty-printed object per item, back to back
+            refs = json.loads(stdin)
+            return "\n".join(json.dumps(items_detail[r["id"]], indent=2) for r in refs)
         raise RuntimeError(f"unexpected op call: {args}")
 
     return _mock
@@ -277,7 +340,7 @@ class TestResolveFromOp:
 
         call_count = 0
 
-        def _mock(args, sa_token):
+        def _mock(args, sa_token, stdin=None):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
@@ -288,6 +351,26 @@ class TestResolveFromOp:
             with pytest.raises(RuntimeError, match="not found"):
                 resolve_from_op("fake-token")
 
+    def test_fetches_all_items_in_one_get(self, monkeypatch):
+        items_list = [{"id": f"id{i}", "title": f"item-{i}"} for i in range(3)]
+        items_detail = {
+            f"id{i}": {
+                "id": f"id{i}",
+                "title": f"item-{i}",
+                "fields": [{"id": "f1", "type": "STRING", "label": "key", "value": str(i)}],
+            }
+            for i in range(3)
+        }
+
+        monkeypatch.setattr(settings, "op_vault", "")
+        mock = MagicMock(side_effect=_mock_op_run_factory(items_list, items_detail))
+
+        with patch("brainbox.secrets._op_run", mock):
+            result = resolve_from_op("fake-token")
+
+        assert result == {"ITEM_0_KEY": "0", "ITEM_1_KEY": "1", "ITEM_2_KEY": "2"}
+        assert mock.call_count == 2
+
     def test_name_collision_last_wins(self, monkeypatch):
         """When two fields produce the same env name, last one wins."""
         items_list = [
@@ -16,8 +16,17 @@ Exit codes:
 
 import json
 import re
+import select
 import sys
 
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib handles bytes too
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 
 # =============================================================================
 # Patterns — network write operations to block
@@ -26,16 +35,16 @@ import sys
 # Bash commands that perform HTTP writes
 BASH_WRITE_PATTERNS = [
     # curl with explicit write methods
-    (r"curl\b.*\s+(-X\s*|--request[\s=])(POST|PUT|DELETE|PATCH)\b",
+    (r"curl\b(?:.*\S)?\s+(-X\s*|--request[\s=])(POST|PUT|DELETE|PATCH)\b",
      "curl with write method"),
     # curl with data flags (implies POST)
-    (r"curl\b.*\s+(-d\b|--data\b|--data-\w+\b|--form\b|-F\b)",
+    (r"curl\b(?:.*\S)?\s+(-d\b|--data\b|--data-\w+\b|--form\b|-F\b)",
      "curl with data payload (implies POST)"),
     # wget write methods
-    (r"wget\b.*\s+(--post-data\b|--post-file\b|--method[\s=](POST|PUT|DELETE|PATCH))",
+    (r"wget\b(?:.*\S)?\s+(--post-data\b|--post-file\b|--method[\s=](POST|PUT|DELETE|PATCH))",
      "wget with write method"),
     # httpie write methods
-    (r"\bhttps?\s+.*\b(POST|PUT|DELETE|PATCH)\b",
+    (r"\bhttps?\s+(?=\S).*\b(POST|PUT|DELETE|PATCH)\b",
      "httpie with write method"),
     # python requests write methods
     (r"requests\.(post|put|delete|patch)\s*\(",
@@ -48,6 +57,21 @@ BASH_WRITE_PATTERNS = [
      "node fetch/axios write call"),
 ]
 
+# All write patterns fused into one alternation so a command is scanned once.
+# Each pattern is wrapped in a named group p<i>; lastgroup maps back to it.
+_BASH_WRITE_RE = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, (pattern, _) in enumerate(BASH_WRITE_PATTERNS)),
+    re.IGNORECASE,
+)
+_BASH_WRITE_DESCRIPTIONS = [description for _, description in BASH_WRITE_PATTERNS]
+
+# Literal prefilter: every write pattern contains one of these tokens, so a
+# command without any of them (most commands) never reaches the full pattern.
+# Keep in sync with BASH_WRITE_PATTERNS. Searched with the same re.IGNORECASE
+# flag, so non-ASCII case matches (e.g. "ı" for "i") agree with the patterns.
+_BASH_WRITE_KEYWORDS = ("curl", "wget", "http", "requests", "fetch", "axios")
+_BASH_WRITE_KEYWORDS_RE = re.compile("|".join(_BASH_WRITE_KEYWORDS), re.IGNORECASE)
+
 # Playwright MCP tools that interact with page elements (form submission, clicks)
 PLAYWRIGHT_WRITE_PATTERN = re.compile(
     r"mcp__playwright__\w*("
@@ -57,6 +81,16 @@ PLAYWRIGHT_WRITE_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+# Exact names of the Playwright MCP interaction tools; a set lookup settles
+# these without running the regex, which stays as the fallback for others.
+PLAYWRIGHT_WRITE_TOOLS = frozenset(
+    f"mcp__playwright__browser_{name}"
+    for name in (
+        "click", "drag", "file_upload", "fill_form", "hover",
+        "press_key", "select_option", "type",
+    )
+)
+
 
 # =============================================================================
 # Allowlist — destinations always permitted regardless of HTTP method
@@ -68,12 +102,12 @@ ALLOWED_DESTINATIONS = [
 ]
 
 
+_ALLOWED_DESTINATIONS_RE = [re.compile(pattern) for pattern in ALLOWED_DESTINATIONS]
+
+
 def is_allowlisted(command: str) -> bool:
     """Return True if the command targets an explicitly allowed destination."""
-    for pattern in ALLOWED_DESTINATIONS:
-        if re.search(pattern, command):
-            return True
-    return False
+    return any(rx.search(command) for rx in _ALLOWED_DESTINATIONS_RE)
 
 
 # =============================================================================
@@ -84,15 +118,17 @@ def check_bash_command(command: str) -> str | None:
     """Check if a Bash command performs a network write. Returns description or None."""
     if is_allowlisted(command):
         return None
-    for pattern, description in BASH_WRITE_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return description
+    if not _BASH_WRITE_KEYWORDS_RE.search(command):
+        return None
+    m = _BASH_WRITE_RE.search(command)
+    if m:
+        return _BASH_WRITE_DESCRIPTIONS[int(m.lastgroup[1:])]
     return None
 
 
 def check_tool_name(tool_name: str) -> str | None:
     """Check if an MCP tool name is a write operation. Returns description or None."""
-    if PLAYWRIGHT_WRITE_PATTERN.match(tool_name):
+    if tool_name in PLAYWRIGHT_WRITE_TOOLS or PLAYWRIGHT_WRITE_PATTERN.match(tool_name):
         return f"Playwright interaction: {tool_name}"
     return None
 
@@ -101,13 +137,22 @@ def check_tool_name(tool_name: str) -> str | None:
 # Main
 # =============================================================================
 
+# Seconds to wait for hook input before failing open
+STDIN_TIMEOUT = 2.0
+
+
 def main():
     try:
-        raw_input = sys.stdin.read().strip()
+        # Don't hang on a writer that never sends anything; fail open instead
+        ready, _, _ = select.select([sys.stdin], [], [], STDIN_TIMEOUT)
+        if not ready:
+            sys.exit(0)
+
+        raw_input = sys.stdin.buffer.read().strip()
         if not raw_input:
             sys.exit(0)
 
-        tool_data = json.loads(raw_input)
+        tool_data = _json_loads(raw_input)
         tool_name = tool_data.get("tool_name", "")
         tool_input = tool_data.get("tool_input", {})
 
@@ -136,7 +181,7 @@ def main():
                     ),
                 },
             }
-            print(json.dumps(output))
+            sys.stdout.buffer.write(_json_dumps(output) + b"\n")
 
         sys.exit(0)
 
@@ -20,7 +20,8 @@ TOOL_DATA=$(cat)
 
 # Call Python script for pattern matching
 # Python outputs decision JSON to stdout, exits 0 for decisions, non-zero for errors
-RESULT=$(python3 "$SCRIPT_DIR/guardrail.py" <<< "$TOOL_DATA") || {
+# -S skips site-packages setup: guardrail.py is stdlib-only and runs on every tool call
+RESULT=$(python3 -S "$SCRIPT_DIR/guardrail.py" <<< "$TOOL_DATA") || {
     # Python error - fail open (allow) to avoid blocking legitimate operations
     exit 0
 }
@@ -13,9 +13,11 @@ Exit codes:
 import json
 import os
 import re
+import select
 import sys
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -39,6 +41,22 @@ class Decision(Enum):
     ASK = "ask"                # Require user confirmation
 
 
+# Lower rank = more severe; used to pick the deciding match
+SEVERITY_RANK = {
+    Severity.CRITICAL: 0,
+    Severity.HIGH: 1,
+    Severity.MEDIUM: 2,
+    Severity.LOW: 3,
+}
+
+SEVERITY_DECISION = {
+    Severity.CRITICAL: Decision.DENY,
+    Severity.HIGH: Decision.ASK,
+    Severity.MEDIUM: Decision.ASK,
+    Severity.LOW: Decision.ALLOW,
+}
+
+
 @dataclass
 class Pattern:
     """A destructive operation pattern."""
@@ -50,6 +68,12 @@ class Pattern:
     tool: str                  # Which tool this applies to: Bash, Write, Edit, *
     field: str                 # Which field to match: command, file_path, content
 
+    @cached_property
+    def compiled(self) -> "re.Pattern[str]":
+        """Regex compiled on first use (case insensitive for SQL)."""
+        flags = re.IGNORECASE if self.category == "database_destructive" else 0
+        return re.compile(self.pattern, flags)
+
 
 @dataclass
 class Match:
@@ -71,7 +95,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "rm_root",
         "severity": "critical",
         "category": "file_deletion",
-        "pattern": r"rm\s+(-[a-zA-Z]*[rf][a-zA-Z]*\s+)*(/|/\*|/bin|/boot|/dev|/etc|/home|/lib|/lib64|/opt|/proc|/root|/sbin|/srv|/sys|/tmp|/usr|/var)(\s|$|/\*)",
+        "pattern": r"rm\s+(-(?=[a-zA-Z]*[rf])[a-zA-Z]+\s+)*(/|/\*|/bin|/boot|/dev|/etc|/home|/lib|/lib64|/opt|/proc|/root|/sbin|/srv|/sys|/tmp|/usr|/var)(\s|$|/\*)",
         "description": "Recursive deletion of root or system directories",
         "tool": "Bash",
         "field": "command"
@@ -80,7 +104,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "dd_device",
         "severity": "critical",
         "category": "disk_destruction",
-        "pattern": r"dd\s+.*if=.*(of=/dev/(sd[a-z]|nvme|hd[a-z]|vd[a-z]|disk|rdisk))",
+        "pattern": r"dd\s+(?=\S)(?:(?!if=).)*if=.*(of=/dev/(sd[a-z]|nvme|hd[a-z]|vd[a-z]|disk|rdisk))",
         "description": "Direct disk write with dd (can destroy partitions)",
         "tool": "Bash",
         "field": "command"
@@ -89,7 +113,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "mkfs_device",
         "severity": "critical",
         "category": "disk_destruction",
-        "pattern": r"mkfs(\.[a-z0-9]+)?\s+.*(/dev/|LABEL=|UUID=)",
+        "pattern": r"mkfs(\.[a-z0-9]+)?\s+(?=\S).*(/dev/|LABEL=|UUID=)",
         "description": "Filesystem creation (destroys existing data)",
         "tool": "Bash",
         "field": "command"
@@ -98,7 +122,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "git_force_push_main",
         "severity": "critical",
         "category": "git_destructive",
-        "pattern": r"git\s+push\s+.*(-f|--force|--force-with-lease).*\s+(origin\s+)?(main|master)(\s|$|:)",
+        "pattern": r"git\s+push\s+(?=\S)(?:(?!-f|--force).)*(-f|--force|--force-with-lease)(?:.*\S)?\s+(origin\s+)?(main|master)(\s|$|:)",
         "description": "Force push to main/master branch",
         "tool": "Bash",
         "field": "command"
@@ -147,7 +171,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "rm_recursive",
         "severity": "high",
         "category": "file_deletion",
-        "pattern": r"rm\s+(-[a-zA-Z]*[rf][a-zA-Z]*\s+)+",
+        "pattern": r"rm\s+(-(?=[a-zA-Z]*[rf])[a-zA-Z]+\s+)+",
         "description": "Recursive file deletion",
         "tool": "Bash",
         "field": "command"
@@ -156,7 +180,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "rm_force",
         "severity": "high",
         "category": "file_deletion",
-        "pattern": r"rm\s+(-[a-zA-Z]*f[a-zA-Z]*\s+)+",
+        "pattern": r"rm\s+(-(?=[a-zA-Z]*f)[a-zA-Z]+\s+)+",
         "description": "Forced file deletion (no confirmation)",
         "tool": "Bash",
         "field": "command"
@@ -183,7 +207,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "git_force_push",
         "severity": "high",
         "category": "git_destructive",
-        "pattern": r"git\s+push\s+.*(-f|--force|--force-with-lease)",
+        "pattern": r"git\s+push\s+(?=\S).*(-f|--force|--force-with-lease)",
         "description": "Git force push (can overwrite remote history)",
         "tool": "Bash",
         "field": "command"
@@ -192,7 +216,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "git_rebase_remote",
         "severity": "high",
         "category": "git_destructive",
-        "pattern": r"git\s+rebase\s+.*origin/",
+        "pattern": r"git\s+rebase\s+(?=\S).*origin/",
         "description": "Git rebase on remote branch (rewrites history)",
         "tool": "Bash",
         "field": "command"
@@ -228,7 +252,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "gcloud_delete",
         "severity": "high",
         "category": "cloud_destructive",
-        "pattern": r"gcloud\s+.*(delete|destroy)\s+",
+        "pattern": r"gcloud\s+(?=\S).*(delete|destroy)\s+",
         "description": "GCP resource deletion",
         "tool": "Bash",
         "field": "command"
@@ -237,7 +261,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "az_delete",
         "severity": "high",
         "category": "cloud_destructive",
-        "pattern": r"az\s+.*(delete|destroy)\s+",
+        "pattern": r"az\s+(?=\S).*(delete|destroy)\s+",
         "description": "Azure resource deletion",
         "tool": "Bash",
         "field": "command"
@@ -255,7 +279,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "kubectl_delete_all",
         "severity": "high",
         "category": "cloud_destructive",
-        "pattern": r"kubectl\s+delete\s+.*--all(\s|$)",
+        "pattern": r"kubectl\s+delete\s+(?=\S).*--all(\s|$)",
         "description": "Kubernetes delete all resources",
         "tool": "Bash",
         "field": "command"
@@ -282,7 +306,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "docker_rm_force",
         "severity": "high",
         "category": "container_destructive",
-        "pattern": r"docker\s+(rm|rmi)\s+.*(-f|--force)",
+        "pattern": r"docker\s+(rm|rmi)\s+(?=\S).*(-f|--force)",
         "description": "Forced Docker container/image removal",
         "tool": "Bash",
         "field": "command"
@@ -322,7 +346,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "kubectl_apply_force",
         "severity": "medium",
         "category": "cloud_destructive",
-        "pattern": r"kubectl\s+apply\s+.*--force",
+        "pattern": r"kubectl\s+apply\s+(?=\S).*--force",
         "description": "Kubernetes force apply (may replace resources)",
         "tool": "Bash",
         "field": "command"
@@ -371,7 +395,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "docker_rm_developer",
         "severity": "high",
         "category": "container_destructive",
-        "pattern": r"docker\s+rm\s+.*developer-",
+        "pattern": r"docker\s+rm\s+(?=\S).*developer-",
         "description": "Docker removal of developer container",
         "tool": "Bash",
         "field": "command"
@@ -380,7 +404,7 @@ DEFAULT_PATTERNS: List[Dict] = [
         "name": "docker_stop_developer",
         "severity": "medium",
         "category": "container_destructive",
-        "pattern": r"docker\s+stop\s+.*developer-",
+        "pattern": r"docker\s+stop\s+(?=\S).*developer-",
         "description": "Docker stop of developer container",
         "tool": "Bash",
         "field": "command"
@@ -521,36 +545,52 @@ def match_patterns(
     tool_input: Dict,
     patterns: List[Pattern]
 ) -> List[Match]:
-    """Match tool input against patterns."""
+    """Match tool input against patterns.
+
+    Stops at the first CRITICAL match: the decision is already DENY and
+    determine_decision() would report that match regardless of later ones.
+    """
     matches = []
+    # Patterns share a handful of tool specs and fields; resolve each once per event
+    tool_ok: Dict[str, bool] = {}
+    texts: Dict[str, Optional[str]] = {}
 
     for pattern in patterns:
         # Check tool type matches
-        if not tool_matches(pattern.tool, tool_name):
+        ok = tool_ok.get(pattern.tool)
+        if ok is None:
+            ok = tool_ok[pattern.tool] = tool_matches(pattern.tool, tool_name)
+        if not ok:
             continue
 
         # Extract field to match
-        text = extract_field(tool_name, tool_input, pattern.field)
+        if pattern.field not in texts:
+            texts[pattern.field] = extract_field(tool_name, tool_input, pattern.field)
+        text = texts[pattern.field]
         if not text:
             continue
 
-        # Try regex match (case insensitive for SQL)
-        flags = re.IGNORECASE if pattern.category == "database_destructive" else 0
-        match_obj = re.search(pattern.pattern, text, flags)
-        if match_obj:
-                start = max(0, match_obj.start() - 20)
-                end = min(len(text), match_obj.end() + 20)
-                context = text[start:end]
-                if start > 0:
-                    context = "..." + context
-                if end < len(text):
-                    context = context + "..."
-
-                matches.append(Match(
-                    pattern=pattern,
-                    matched_text=match_obj.group(),
-                    context=context,
-                ))
+        match_obj = pattern.compiled.search(text)
+        if not match_obj:
+            continue
+
+        # Up to 20 chars either side of the hit, with ellipses where cut
+        start, end = match_obj.span()
+        start = start - 20 if start > 20 else 0
+        end = min(len(text), end + 20)
+        context = "".join((
+            "..." if start else "",
+            text[start:end],
+            "..." if end < len(text) else "",
+        ))
+
+        matches.append(Match(
+            pattern=pattern,
+            matched_text=match_obj.group(),
+            context=context,
+        ))
+        if pattern.severity == Severity.CRITICAL:
+            break
 
     return matches
 
@@ -560,24 +600,26 @@ def determine_decision(matches: List[Match]) -> Tuple[Decision, Optional[Match]]
     if not matches:
         return Decision.ALLOW, None
 
-    # Find highest severity match
-    severity_order = [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW]
-
-    for severity in severity_order:
-        for match in matches:
-            if match.pattern.severity == severity:
-                if severity == Severity.CRITICAL:
-                    return Decision.DENY, match
-                elif severity in (Severity.HIGH, Severity.MEDIUM):
-                    return Decision.ASK, match
-
-    return Decision.ALLOW, None
+    # Highest severity wins; min() keeps the first match among equals
+    match = min(matches, key=lambda m: SEVERITY_RANK[m.pattern.severity])
+    decision = SEVERITY_DECISION[match.pattern.severity]
+    if decision == Decision.ALLOW:
+        return Decision.ALLOW, None
+    return decision, match
 
 
 # =============================================================================
 # Output Generation
 # =============================================================================
 
+SEVERITY_LABEL = {
+    Severity.CRITICAL: "[BLOCKED]",
+    Severity.HIGH: "[CONFIRM REQUIRED]",
+    Severity.MEDIUM: "[CONFIRM REQUIRED]",
+    Severity.LOW: "[WARNING]",
+}
+
+
 def format_output(decision: Decision, match: Optional[Match]) -> str:
     """Format the hook output JSON."""
     if decision == Decision.ALLOW:
@@ -587,15 +629,8 @@ def format_output(decision: Decision, match: Optional[Match]) -> str:
         return ""
 
     # Build human-readable message
-    severity_emoji = {
-        Severity.CRITICAL: "[BLOCKED]",
-        Severity.HIGH: "[CONFIRM REQUIRED]",
-        Severity.MEDIUM: "[CONFIRM REQUIRED]",
-        Severity.LOW: "[WARNING]",
-    }
-
     message_parts = [
-        f"{severity_emoji[match.pattern.severity]} {match.pattern.description}",
+        f"{SEVERITY_LABEL[match.pattern.severity]} {match.pattern.description}",
         f"Pattern: {match.pattern.name} ({match.pattern.category})",
         f"Matched: {match.context}",
     ]
@@ -654,6 +689,26 @@ def list_patterns():
 # Main
 # =============================================================================
 
+# Seconds to wait for hook input before failing open
+STDIN_TIMEOUT = 2.0
+
+
+def read_stdin(timeout: float) -> Optional[bytes]:
+    """Read all of stdin, or return None if nothing arrives within timeout.
+
+    The timeout needs select(), which on Windows only accepts sockets; there
+    (or for any stdin select() can't watch) this blocks on the read instead.
+    """
+    stdin = sys.stdin.buffer
+    try:
+        ready, _, _ = select.select([stdin], [], [], timeout)
+    except (OSError, ValueError):
+        ready = True
+    if not ready:
+        return None
+    return stdin.read()
+
+
 def main():
     """Main entry point."""
     # Handle --list-patterns flag (no stdin needed, bypasses pattern matching)
@@ -662,8 +717,11 @@ def main():
         sys.exit(0)
 
     try:
-        # Read tool data from stdin
-        raw_input = sys.stdin.read().strip()
+        # Read tool data from stdin, failing open if none arrives in time
+        raw_input = read_stdin(STDIN_TIMEOUT)
+        if raw_input is None:
+            sys.exit(0)
+        raw_input = raw_input.strip()
         if not raw_input:
             sys.exit(0)  # Allow if no input
 
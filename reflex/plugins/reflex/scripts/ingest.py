@@ -14,7 +14,7 @@ Supported formats:
 - Code files (.py, .js, .ts, .go, .rs, .java, .c, .cpp, .rb, .sh)
 
 Usage:
-    uvx --with pymupdf,fastembed,qdrant-client,python-docx,ebooklib,beautifulsoup4 \
+    uvx --with pymupdf,fastembed,qdrant-client,python-docx,ebooklib,beautifulsoup4,lxml \
         python ingest.py <path> [--collection NAME] [--chunk-size WORDS]
 
 Examples:
@@ -26,14 +26,17 @@ Examples:
 import argparse
 import hashlib
 import json
+import mmap
 import os
 import re
 import sys
 import time
 import uuid
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 
 # =============================================================================
@@ -70,6 +73,11 @@ class FileSizeError(IngestError):
 # =============================================================================
 
 MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+UPLOAD_BATCH_POINTS = 512  # Points buffered across files before one upload
+MMAP_THRESHOLD = 1024 * 1024  # Larger text files are decoded from a memory map
+DEFAULT_NUM_PROCESSES = 2  # Extraction workers; the embedder already uses every core
+MAX_FILES_IN_FLIGHT = 4  # Loaded files held in memory at once, whatever the worker count
 
 
 # =============================================================================
@@ -77,25 +85,54 @@ MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
 # =============================================================================
 
 try:
+    import grpc
     from qdrant_client import QdrantClient
-    from qdrant_client.models import PointStruct, VectorParams, Distance
+    from qdrant_client.models import (
+        PointStruct, VectorParams, Distance,
+        ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+    )
 except ImportError:
     raise DependencyError(
         "qdrant-client not installed. Run: pip install qdrant-client"
     )
 
 try:
+    import numpy as np
     from fastembed import TextEmbedding
 except ImportError:
     raise DependencyError(
         "fastembed not installed. Run: pip install fastembed"
     )
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib parses bytes too
+    _json_loads = json.loads
+
 
 # =============================================================================
 # Extractors for different file formats
 # =============================================================================
 
+def read_text_file(path: Path) -> str:
+    """
+    Read a UTF-8 text file, dropping undecodable bytes.
+
+    Files above MMAP_THRESHOLD are decoded straight from a memory map, so the
+    raw bytes never sit in memory alongside the decoded string.
+    """
+    if path.stat().st_size <= MMAP_THRESHOLD:
+        return path.read_text(encoding="utf-8", errors="ignore")
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = str(mm, "utf-8", "ignore")
+
+    # Match read_text()'s universal newline handling
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def extract_pdf(path: Path) -> Tuple[str, Dict]:
     """Extract text from PDF using PyMuPDF."""
     try:
@@ -116,16 +153,25 @@ def extract_pdf(path: Path) -> Tuple[str, Dict]:
 
 def extract_markdown(path: Path) -> Tuple[str, Dict]:
     """Extract text from Markdown file."""
-    text = path.read_text(encoding="utf-8", errors="ignore")
+    text = read_text_file(path)
     return text, {"format": "markdown"}
 
 
 def extract_text(path: Path) -> Tuple[str, Dict]:
     """Extract text from plain text file."""
-    text = path.read_text(encoding="utf-8", errors="ignore")
+    text = read_text_file(path)
     return text, {"format": "text"}
 
 
+def html_parser_name() -> str:
+    """BeautifulSoup tree builder to use: lxml's C parser if installed."""
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
 def extract_html(path: Path) -> Tuple[str, Dict]:
     """Extract text from HTML file."""
     try:
@@ -133,8 +179,8 @@ def extract_html(path: Path) -> Tuple[str, Dict]:
     except ImportError:
         raise ExtractorError("beautifulsoup4 not installed. Run: pip install beautifulsoup4")
 
-    html = path.read_text(encoding="utf-8", errors="ignore")
-    soup = BeautifulSoup(html, "html.parser")
+    html = read_text_file(path)
+    soup = BeautifulSoup(html, html_parser_name())
 
     # Remove scripts, styles, nav, footer
     for tag in soup.find_all(["script", "style", "nav", "footer", "aside"]):
@@ -169,10 +215,11 @@ def extract_epub(path: Path) -> Tuple[str, Dict]:
     author = author[0][0] if author else None
 
     # Extract text from all documents
+    parser = html_parser_name()
     chapters = []
     for item in book.get_items():
         if item.get_type() == ebooklib.ITEM_DOCUMENT:
-            soup = BeautifulSoup(item.get_content(), "html.parser")
+            soup = BeautifulSoup(item.get_content(), parser)
             text = soup.get_text(separator="\n", strip=True)
             if text:
                 chapters.append(text)
@@ -213,7 +260,7 @@ def extract_docx(path: Path) -> Tuple[str, Dict]:
 def extract_notebook(path: Path) -> Tuple[str, Dict]:
     """Extract text from Jupyter notebook."""
     try:
-        content = json.loads(path.read_text(encoding="utf-8"))
+        content = _json_loads(path.read_bytes())
     except json.JSONDecodeError as e:
         raise IngestError(f"Failed to parse Jupyter notebook {path.name}: {e}") from e
 
@@ -241,7 +288,7 @@ def extract_notebook(path: Path) -> Tuple[str, Dict]:
 
 def extract_mermaid(path: Path) -> Tuple[str, Dict]:
     """Extract Mermaid diagram with metadata."""
-    text = path.read_text(encoding="utf-8", errors="ignore")
+    text = read_text_file(path)
 
     # Detect diagram type from content
     diagram_type = detect_mermaid_type(text)
@@ -269,6 +316,24 @@ def extract_mermaid(path: Path) -> Tuple[str, Dict]:
     }
 
 
+# Diagram declaration prefixes (lowercased); the group name is the type
+MERMAID_TYPE_RE = re.compile(
+    r'(?P<flowchart>graph |flowchart )'
+    r'|(?P<sequence>sequencediagram)'
+    r'|(?P<class>classdiagram)'
+    r'|(?P<state>statediagram)'
+    r'|(?P<er>erdiagram)'
+    r'|(?P<gantt>gantt)'
+    r'|(?P<pie>pie)'
+    r'|(?P<journey>journey)'
+    r'|(?P<git>gitgraph)'
+    r'|(?P<c4>c4context|c4container)'
+    r'|(?P<mindmap>mindmap)'
+    r'|(?P<timeline>timeline)'
+    r'|(?P<architecture>architecture)'
+)
+
+
 def detect_mermaid_type(text: str) -> str:
     """Detect the type of Mermaid diagram."""
     # Skip comment lines to find the diagram declaration
@@ -282,95 +347,72 @@ def detect_mermaid_type(text: str) -> str:
     else:
         text_lower = text.strip().lower()
 
-    if text_lower.startswith("graph ") or text_lower.startswith("flowchart "):
-        return "flowchart"
-    elif text_lower.startswith("sequencediagram"):
-        return "sequence"
-    elif text_lower.startswith("classdiagram"):
-        return "class"
-    elif text_lower.startswith("statediagram"):
-        return "state"
-    elif text_lower.startswith("erdiagram"):
-        return "er"
-    elif text_lower.startswith("gantt"):
-        return "gantt"
-    elif text_lower.startswith("pie"):
-        return "pie"
-    elif text_lower.startswith("journey"):
-        return "journey"
-    elif text_lower.startswith("gitgraph"):
-        return "git"
-    elif text_lower.startswith("c4context") or text_lower.startswith("c4container"):
-        return "c4"
-    elif text_lower.startswith("mindmap"):
-        return "mindmap"
-    elif text_lower.startswith("timeline"):
-        return "timeline"
-    elif text_lower.startswith("architecture"):
-        return "architecture"
-    else:
-        return "unknown"
+    match = MERMAID_TYPE_RE.match(text_lower)
+    return match.lastgroup if match else "unknown"
+
+
+# Architectural patterns and the keywords that suggest them
+DIAGRAM_PATTERN_KEYWORDS = {
+    "microservices": ("service", "api", "gateway", "mesh"),
+    "event-driven": ("event", "queue", "publish", "subscribe", "kafka", "rabbitmq"),
+    "layered": ("presentation", "business", "data", "layer", "controller", "service", "repository"),
+    "client-server": ("client", "server", "request", "response"),
+    "mvc": ("model", "view", "controller"),
+    "cqrs": ("command", "query", "read", "write"),
+    "saga": ("saga", "orchestrat", "compensat"),
+    "circuit-breaker": ("circuit", "breaker", "fallback", "retry"),
+    "api-gateway": ("gateway", "api", "route", "proxy"),
+    "database": ("database", "db", "postgres", "mysql", "mongo", "redis"),
+    "authentication": ("auth", "login", "token", "jwt", "oauth", "sso"),
+    "caching": ("cache", "redis", "memcache"),
+    "load-balancing": ("load", "balancer", "nginx", "haproxy"),
+    "pub-sub": ("pub", "sub", "topic", "subscriber", "publisher"),
+}
 
 
 def detect_diagram_patterns(text: str) -> List[str]:
     """Detect architectural patterns in diagram."""
-    patterns = []
     text_lower = text.lower()
 
-    # Common architectural patterns
-    pattern_keywords = {
-        "microservices": ["service", "api", "gateway", "mesh"],
-        "event-driven": ["event", "queue", "publish", "subscribe", "kafka", "rabbitmq"],
-        "layered": ["presentation", "business", "data", "layer", "controller", "service", "repository"],
-        "client-server": ["client", "server", "request", "response"],
-        "mvc": ["model", "view", "controller"],
-        "cqrs": ["command", "query", "read", "write"],
-        "saga": ["saga", "orchestrat", "compensat"],
-        "circuit-breaker": ["circuit", "breaker", "fallback", "retry"],
-        "api-gateway": ["gateway", "api", "route", "proxy"],
-        "database": ["database", "db", "postgres", "mysql", "mongo", "redis"],
-        "authentication": ["auth", "login", "token", "jwt", "oauth", "sso"],
-        "caching": ["cache", "redis", "memcache"],
-        "load-balancing": ["load", "balancer", "nginx", "haproxy"],
-        "pub-sub": ["pub", "sub", "topic", "subscriber", "publisher"],
-    }
+    return [
+        pattern
+        for pattern, keywords in DIAGRAM_PATTERN_KEYWORDS.items()
+        if any(kw in text_lower for kw in keywords)
+    ]
 
-    for pattern, keywords in pattern_keywords.items():
-        if any(kw in text_lower for kw in keywords):
-            patterns.append(pattern)
 
-    return patterns
+# Node definitions and participant/actor declarations, scanned in one pass.
+# Double-bracket shapes come first so D[[Label]] / E((Label)) win over the
+# single-bracket ones; declarations are a lookahead so they don't consume a
+# node definition that follows them.
+MERMAID_COMPONENT_RE = re.compile(
+    r'(?P<id>\w+)(?:'
+    r'\[\[(?P<subroutine>[^\]]+)\]\]'  # D[[Label]]
+    r'|\(\((?P<circle>[^)]+)\)\)'       # E((Label))
+    r'|\[(?P<square>[^\]]+)\]'          # A[Label]
+    r'|\((?P<round>[^)]+)\)'            # B(Label)
+    r'|\{(?P<rhombus>[^}]+)\}'          # C{Label}
+    r'|>(?P<asymmetric>[^]]+)\]'        # F>Label]
+    r')'
+    r'|(?=(?i:participant|actor)\s+(?P<declared>\w+))'
+)
 
 
 def extract_mermaid_components(text: str) -> List[str]:
     """Extract component/node names from Mermaid diagram."""
     components = set()
 
-    # Match node definitions: A[Label], B(Label), C{Label}, D((Label))
-    node_patterns = [
-        r'(\w+)\[([^\]]+)\]',      # A[Label]
-        r'(\w+)\(([^)]+)\)',        # B(Label)
-        r'(\w+)\{([^}]+)\}',        # C{Label}
-        r'(\w+)\[\[([^\]]+)\]\]',   # D[[Label]]
-        r'(\w+)\(\(([^)]+)\)\)',    # E((Label))
-        r'(\w+)>([^]]+)\]',         # F>Label]
-    ]
-
-    for pattern in node_patterns:
-        for match in re.finditer(pattern, text):
-            # Add both the ID and the label
-            components.add(match.group(1))
-            label = match.group(2).strip()
-            if label and len(label) < 50:  # Reasonable label length
-                components.add(label)
-
-    # Match participant declarations in sequence diagrams
-    participant_match = re.findall(r'participant\s+(\w+)', text, re.IGNORECASE)
-    components.update(participant_match)
+    for match in MERMAID_COMPONENT_RE.finditer(text):
+        # Participant/actor declarations in sequence diagrams
+        if match["declared"]:
+            components.add(match["declared"])
+            continue
 
-    # Match actor declarations
-    actor_match = re.findall(r'actor\s+(\w+)', text, re.IGNORECASE)
-    components.update(actor_match)
+        # Node definitions: add both the ID and the label
+        components.add(match["id"])
+        label = match[match.lastgroup].strip()
+        if label and len(label) < 50:  # Reasonable label length
+            components.add(label)
 
     return list(components)
 
@@ -395,7 +437,7 @@ def extract_mermaid_description(text: str) -> Optional[str]:
 
 def extract_code(path: Path) -> Tuple[str, Dict]:
     """Extract text from code file."""
-    text = path.read_text(encoding="utf-8", errors="ignore")
+    text = read_text_file(path)
 
     # Detect language from extension
     ext_to_lang = {
@@ -463,9 +505,9 @@ EXTRACTORS = {
 }
 
 
-def is_supported(path: Path) -> bool:
-    """Check if file format is supported."""
-    return path.suffix.lower() in EXTRACTORS
+def is_supported(path: Union[str, Path]) -> bool:
+    """Check if file format is supported (accepts a Path or a bare file name)."""
+    return os.path.splitext(path)[1].lower() in EXTRACTORS
 
 
 def extract(path: Path) -> Tuple[str, Dict]:
@@ -483,6 +525,9 @@ def extract(path: Path) -> Tuple[str, Dict]:
 # Chunking
 # =============================================================================
 
+PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+
+
 def chunk_text(
     text: str,
     chunk_size: int = 400,
@@ -499,14 +544,16 @@ def chunk_text(
     Returns:
         List of chunk dicts with content and word_count
     """
-    # Split into paragraphs
-    paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text) if p.strip()]
-
     chunks = []
     current = []
     current_words = 0
+    last_words = 0  # Word count of current[-1], reused for the overlap
 
-    for para in paragraphs:
+    # Split into paragraphs, counting each paragraph's words once
+    for para in PARAGRAPH_BREAK_RE.split(text):
+        para = para.strip()
+        if not para:
+            continue
         para_words = len(para.split())
 
         # If adding this paragraph exceeds limit, save current chunk
@@ -517,15 +564,16 @@ def chunk_text(
             })
 
             # Keep last paragraph for overlap
-            if current and len(current[-1].split()) <= overlap:
+            if last_words <= overlap:
                 current = [current[-1]]
-                current_words = len(current[-1].split())
+                current_words = last_words
             else:
                 current = []
                 current_words = 0
 
         current.append(para)
         current_words += para_words
+        last_words = para_words
 
     # Don't forget last chunk
     if current:
@@ -561,12 +609,28 @@ def connect_to_qdrant(
         QdrantConnectionError: If all connection attempts fail
     """
     last_error = None
+    # gRPC (Protobuf) uploads are much smaller than JSON for vectors. Once the
+    # gRPC port (6334) proves unreachable, stay on REST for later attempts.
+    prefer_grpc = True
 
     for attempt in range(1, max_retries + 1):
         try:
-            client = QdrantClient(url=qdrant_url, timeout=10)
-            # Test connection by listing collections
-            client.get_collections()
+            client = QdrantClient(url=qdrant_url, prefer_grpc=prefer_grpc, timeout=10)
+            try:
+                # Test connection by listing collections
+                client.get_collections()
+            except grpc.RpcError as e:
+                # Only connectivity failures mean "use REST"; other gRPC errors
+                # (auth, bad URL) are raised rather than hidden by the fallback
+                if e.code() not in (
+                    grpc.StatusCode.UNAVAILABLE,
+                    grpc.StatusCode.DEADLINE_EXCEEDED,
+                ):
+                    raise
+                client.close()
+                prefer_grpc = False
+                client = QdrantClient(url=qdrant_url, timeout=10)
+                client.get_collections()
             return client
         except Exception as e:
             last_error = e
@@ -583,12 +647,87 @@ def connect_to_qdrant(
     raise QdrantConnectionError(f"Failed to connect to Qdrant: {last_error}")
 
 
+def hash_file(path: Path) -> str:
+    """
+    MD5 hex digest of a file, streamed in 1MB blocks.
+
+    MD5 is kept (rather than a faster hash) because point IDs are derived
+    from it; changing it would duplicate every previously ingested file.
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "md5").hexdigest()
+        h = hashlib.md5()
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+        return h.hexdigest()
+
+
+def is_already_ingested(
+    client: QdrantClient,
+    collection: str,
+    point_ids: List[str],
+    chunks: List[Dict],
+    file_path: Path
+) -> bool:
+    """
+    Check whether every chunk is already stored with the same content and path.
+
+    Point IDs are derived from the file hash, so an unchanged file maps to the
+    same IDs; the document and path are compared too since a different chunk
+    size or a moved file reuses those IDs for different payloads.
+    """
+    stored = client.retrieve(
+        collection_name=collection,
+        ids=point_ids,
+        with_payload=["document", "metadata"],
+        with_vectors=False
+    )
+    if len(stored) != len(point_ids):
+        return False
+
+    documents = {
+        str(p.id): p.payload.get("document") for p in stored
+        if p.payload.get("metadata", {}).get("original_path") == str(file_path.absolute())
+    }
+    return all(
+        documents.get(point_id) == chunk["content"]
+        for point_id, chunk in zip(point_ids, chunks)
+    )
+
+
+def upload_batch(
+    client: QdrantClient,
+    collection: str,
+    points: List[PointStruct],
+    wait: bool = False
+) -> None:
+    """
+    Upload points to Qdrant in one request stream.
+
+    Runs in this process (parallel=1): a client-side worker pool per call
+    costs more to start than a flush of a few hundred points takes. With
+    wait=False Qdrant acknowledges before applying the points; updates are
+    applied in order, so a final wait=True upload confirms all earlier ones.
+    """
+    client.upload_points(
+        collection_name=collection,
+        points=points,
+        batch_size=256,
+        parallel=1,
+        wait=wait,
+    )
+
+
 def ingest_to_qdrant(
     chunks: List[Dict],
     file_path: Path,
     file_metadata: Dict,
     collection: str,
-    qdrant_url: str = "http://localhost:6333"
+    qdrant_url: str = "http://localhost:6333",
+    client: Optional[QdrantClient] = None,
+    embedder: Optional[TextEmbedding] = None,
+    pending: Optional[List[PointStruct]] = None
 ) -> int:
     """
     Ingest chunks into Qdrant.
@@ -599,6 +738,10 @@ def ingest_to_qdrant(
         file_metadata: Metadata from extraction
         collection: Qdrant collection name
         qdrant_url: Qdrant server URL
+        client: Existing client to reuse (connects to qdrant_url if None)
+        embedder: Existing embedding model to reuse (loaded if None)
+        pending: If given, points are appended here for the caller to
+            upload in a larger batch instead of being uploaded now
 
     Returns:
         Number of chunks ingested
@@ -607,20 +750,41 @@ def ingest_to_qdrant(
         QdrantConnectionError: If connection to Qdrant fails
     """
     # Initialize clients with retry
-    client = connect_to_qdrant(qdrant_url)
-    embedder = TextEmbedding("sentence-transformers/all-MiniLM-L6-v2")
+    if client is None:
+        client = connect_to_qdrant(qdrant_url)
+    if embedder is None:
+        embedder = TextEmbedding(EMBEDDING_MODEL)
 
     # Vector name used by mcp-server-qdrant
     vector_name = "fast-all-minilm-l6-v2"
 
+    # Generate file hash for deduplication (streamed, not read into memory)
+    file_hash = hash_file(file_path)[:12]
+    # Create unique IDs from file hash + chunk index
+    point_ids = [
+        str(uuid.UUID(hex=hashlib.md5(f"{file_hash}_{i}".encode()).hexdigest()))
+        for i in range(len(chunks))
+    ]
+
     # Ensure collection exists
-    collections = [c.name for c in client.get_collections().collections]
-    if collection not in collections:
+    if client.collection_exists(collection):
+        # Re-running over an unchanged file: skip embedding it again
+        if is_already_ingested(client, collection, point_ids, chunks, file_path):
+            print(f"  Unchanged since last ingest, skipped {len(chunks)} chunks")
+            return len(chunks)
+    else:
         client.create_collection(
             collection_name=collection,
             vectors_config={
-                vector_name: VectorParams(size=384, distance=Distance.COSINE)
-            }
+                vector_name: VectorParams(
+                    size=384, distance=Distance.COSINE, on_disk=True
+                )
+            },
+            # FP32 originals live on disk; searches use the int8 copies held
+            # in RAM (4x smaller), with negligible recall loss for MiniLM
+            quantization_config=ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+            ),
         )
         print(f"Created collection: {collection}")
 
@@ -629,15 +793,11 @@ def ingest_to_qdrant(
     contents = [c["content"] for c in chunks]
 
     print(f"Generating embeddings for {len(chunks)} chunks...")
-    embeddings = list(embedder.embed(contents))
-
-    # Generate file hash for deduplication
-    file_hash = hashlib.md5(file_path.read_bytes()).hexdigest()[:12]
-
-    for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-        # Create unique ID from file hash + chunk index
-        point_id = str(uuid.UUID(hex=hashlib.md5(f"{file_hash}_{i}".encode()).hexdigest()))
+    # Stack into one (N, 384) array and convert to lists in a single call
+    # rather than one .tolist() per point
+    embeddings = np.vstack(list(embedder.embed(contents))).tolist()
 
+    for i, (chunk, embedding, point_id) in enumerate(zip(chunks, embeddings, point_ids)):
         # Build metadata
         metadata = {
             "source": "local_file",
@@ -654,19 +814,20 @@ def ingest_to_qdrant(
         # Use named vector to match mcp-server-qdrant format
         points.append(PointStruct(
             id=point_id,
-            vector={vector_name: embedding.tolist()},
+            vector={vector_name: embedding},
             payload={
                 "document": chunk["content"],
                 "metadata": metadata
             }
         ))
 
-    # Upsert in batches
-    batch_size = 100
-    for i in range(0, len(points), batch_size):
-        batch = points[i:i + batch_size]
-        client.upsert(collection_name=collection, points=batch)
-        print(f"  Ingested {min(i + batch_size, len(points))}/{len(points)} chunks")
+    if pending is not None:
+        pending.extend(points)
+        print(f"  Queued {len(points)} chunks for upload")
+        return len(points)
+
+    upload_batch(client, collection, points, wait=True)
+    print(f"  Ingested {len(points)}/{len(points)} chunks")
 
     return len(points)
 
@@ -675,16 +836,12 @@ def ingest_to_qdrant(
 # Main
 # =============================================================================
 
-def process_file(
+def load_file(
     path: Path,
-    collection: str,
     chunk_size: int,
-    qdrant_url: str,
     max_file_size: int = MAX_FILE_SIZE
-) -> Dict:
-    """Process a single file."""
-    print(f"\nProcessing: {path.name}")
-
+) -> Tuple[List[Dict], Dict, int]:
+    """Extract and chunk a single file. Returns (chunks, metadata, word count)."""
     # Check file size
     file_size = path.stat().st_size
     if file_size > max_file_size:
@@ -698,12 +855,36 @@ def process_file(
     text, metadata = extract(path)
 
     if not text.strip():
+        return [], metadata, 0
+
+    # Chunk
+    return chunk_text(text, chunk_size=chunk_size), metadata, len(text.split())
+
+
+def process_file(
+    path: Path,
+    collection: str,
+    chunk_size: int,
+    qdrant_url: str,
+    max_file_size: int = MAX_FILE_SIZE,
+    loaded: Optional[Future] = None,
+    client: Optional[QdrantClient] = None,
+    embedder: Optional[TextEmbedding] = None,
+    pending: Optional[List[PointStruct]] = None
+) -> Dict:
+    """Process a single file (optionally already loaded in the background)."""
+    print(f"\nProcessing: {path.name}")
+
+    if loaded is not None:
+        chunks, metadata, word_count = loaded.result()
+    else:
+        chunks, metadata, word_count = load_file(path, chunk_size, max_file_size)
+
+    if not chunks:
         print(f"  Warning: No text extracted from {path.name}")
         return {"file": str(path), "status": "empty", "chunks": 0}
 
-    # Chunk
-    chunks = chunk_text(text, chunk_size=chunk_size)
-    print(f"  Extracted {len(text.split())} words -> {len(chunks)} chunks")
+    print(f"  Extracted {word_count} words -> {len(chunks)} chunks")
 
     # Ingest
     ingested = ingest_to_qdrant(
@@ -711,7 +892,10 @@ def process_file(
         file_path=path,
         file_metadata=metadata,
         collection=collection,
-        qdrant_url=qdrant_url
+        qdrant_url=qdrant_url,
+        client=client,
+        embedder=embedder,
+        pending=pending
     )
 
     return {
@@ -758,6 +942,12 @@ def main():
         default=int(os.environ.get("MAX_FILE_SIZE_MB", 100)),
         help="Maximum file size in MB (default: 100, or MAX_FILE_SIZE_MB env var)"
     )
+    parser.add_argument(
+        "--num-processes",
+        type=int,
+        default=DEFAULT_NUM_PROCESSES,
+        help=f"Worker processes for extracting and chunking files (default: {DEFAULT_NUM_PROCESSES})"
+    )
 
     args = parser.parse_args()
 
@@ -776,10 +966,12 @@ def main():
         for dirpath, dirnames, filenames in os.walk(args.path, followlinks=False):
             if not args.recursive:
                 dirnames.clear()
-            for filename in filenames:
-                p = Path(dirpath) / filename
-                if is_supported(p):
-                    files.append(p)
+            # Check the extension on the bare name (os.walk already uses
+            # scandir) and only build Paths for supported files
+            files.extend(
+                Path(dirpath, filename) for filename in filenames
+                if is_supported(filename)
+            )
 
         if not files:
             print(f"No supported files found in {args.path}")
@@ -792,54 +984,118 @@ def main():
     print(f"Collection: {args.collection}")
     print(f"Chunk size: {args.chunk_size} words")
 
-    # Process files
+    # Process files. Upcoming files are extracted and chunked in worker
+    # processes while the current one is embedded and uploaded here; the
+    # embedding model stays in this process since ONNX Runtime already uses
+    # every core. Results are taken in order, with at most MAX_FILES_IN_FLIGHT
+    # files loaded or loading at once, so output stays sequential and memory
+    # stays bounded even with many workers and large files.
     results = []
-    for path in files:
+    client = None
+    embedder = None
+
+    # Points are buffered across files and uploaded UPLOAD_BATCH_POINTS at
+    # a time, so a tree of small files isn't one upload request per file
+    pending_points = []
+    pending_results = []  # Results of the files whose points are buffered
+
+    def flush_pending(wait=False):
+        if not pending_points:
+            return
         try:
-            result = process_file(
-                path=path,
-                collection=args.collection,
-                chunk_size=args.chunk_size,
-                qdrant_url=args.qdrant_url,
-                max_file_size=max_file_size
-            )
-            results.append(result)
-        except QdrantConnectionError as e:
-            # Connection errors are fatal - stop processing
-            print(f"\nFatal: {e}")
-            sys.exit(1)
-        except FileSizeError as e:
-            # File too large - skip with warning
-            print(f"  Skipped: {e}")
-            results.append({
-                "file": str(path),
-                "status": "skipped",
-                "error": str(e)
-            })
-        except (ExtractorError, IngestError) as e:
-            # Extraction/ingestion errors - log and continue
-            print(f"  Error: {e}")
-            results.append({
-                "file": str(path),
-                "status": "error",
-                "error": str(e)
-            })
+            upload_batch(client, args.collection, pending_points, wait=wait)
+            print(f"\nUploaded {len(pending_points)} chunks from {len(pending_results)} file(s)")
         except Exception as e:
-            # Unexpected errors - log with details and continue
-            print(f"  Unexpected error: {type(e).__name__}: {e}")
-            results.append({
-                "file": str(path),
-                "status": "error",
-                "error": f"{type(e).__name__}: {e}"
-            })
+            # Files in a failed batch are reported as errors
+            print(f"\nUpload failed for {len(pending_results)} file(s): {type(e).__name__}: {e}")
+            for result in pending_results:
+                result.update(status="error", chunks=0, error=f"{type(e).__name__}: {e}")
+        pending_points.clear()
+        pending_results.clear()
+
+    remaining = iter(files)
+    prefetched = deque()
+    num_processes = max(1, args.num_processes)
+    in_flight = min(num_processes + 1, MAX_FILES_IN_FLIGHT)
+    with ProcessPoolExecutor(max_workers=min(num_processes, in_flight)) as pool:
+        def prefetch_next():
+            for next_path in remaining:
+                prefetched.append((next_path, pool.submit(
+                    load_file, next_path, args.chunk_size, max_file_size
+                )))
+                return
+
+        for _ in range(in_flight):
+            prefetch_next()
+
+        while prefetched:
+            path, loaded = prefetched.popleft()
+            prefetch_next()
+            buffered = len(pending_points)
+            try:
+                # Connect and load the model once, shared by all files
+                if client is None:
+                    client = connect_to_qdrant(args.qdrant_url)
+                    embedder = TextEmbedding(EMBEDDING_MODEL)
+                result = process_file(
+                    path=path,
+                    collection=args.collection,
+                    chunk_size=args.chunk_size,
+                    qdrant_url=args.qdrant_url,
+                    max_file_size=max_file_size,
+                    loaded=loaded,
+                    client=client,
+                    embedder=embedder,
+                    pending=pending_points
+                )
+                results.append(result)
+                if result["status"] == "success" and len(pending_points) > buffered:
+                    pending_results.append(result)
+            except QdrantConnectionError as e:
+                # Connection errors are fatal - stop processing
+                print(f"\nFatal: {e}")
+                pool.shutdown(cancel_futures=True)
+                sys.exit(1)
+            except FileSizeError as e:
+                # File too large - skip with warning
+                print(f"  Skipped: {e}")
+                results.append({
+                    "file": str(path),
+                    "status": "skipped",
+                    "error": str(e)
+                })
+            except (ExtractorError, IngestError) as e:
+                # Extraction/ingestion errors - log and continue
+                print(f"  Error: {e}")
+                results.append({
+                    "file": str(path),
+                    "status": "error",
+                    "error": str(e)
+                })
+            except Exception as e:
+                # Unexpected errors - log with details and continue
+                print(f"  Unexpected error: {type(e).__name__}: {e}")
+                results.append({
+                    "file": str(path),
+                    "status": "error",
+                    "error": f"{type(e).__name__}: {e}"
+                })
+
+            # The last file's points are left for the final, waited flush
+            if len(pending_points) >= UPLOAD_BATCH_POINTS and prefetched:
+                flush_pending()
+
+    # Wait for Qdrant to apply everything before reporting files as ingested
+    flush_pending(wait=True)
 
     # Summary
     print("\n" + "=" * 50)
     print("Summary:")
     total_chunks = sum(r.get("chunks", 0) for r in results)
-    success = sum(1 for r in results if r["status"] == "success")
-    skipped = sum(1 for r in results if r["status"] == "skipped")
-    errors = sum(1 for r in results if r["status"] == "error")
+    status_counts = Counter(r["status"] for r in results)
+    success = status_counts["success"]
+    skipped = status_counts["skipped"]
+    errors = status_counts["error"]
 
     print(f"  Files processed: {len(results)}")
     print(f"  Successful: {success}")
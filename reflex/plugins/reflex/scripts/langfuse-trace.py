@@ -10,6 +10,7 @@ Environment variables:
   LANGFUSE_PUBLIC_KEY  - LangFuse public key (required)
   LANGFUSE_SECRET_KEY  - LangFuse secret key (required)
   LANGFUSE_SESSION_ID  - Optional session ID for grouping traces
+  LANGFUSE_DEBUG       - Set to 1/true/yes to write reflex/langfuse-debug.log
 """
 
 import json
@@ -24,14 +25,32 @@ except ImportError:
     # Silently exit if langfuse not installed
     sys.exit(0)
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib parses bytes too
+    _json_loads = json.loads
+
+# Configuration, read once at startup
+LANGFUSE_BASE_URL = os.environ.get("LANGFUSE_BASE_URL", "http://localhost:3000")
+LANGFUSE_PUBLIC_KEY = os.environ.get("LANGFUSE_PUBLIC_KEY")
+LANGFUSE_SECRET_KEY = os.environ.get("LANGFUSE_SECRET_KEY")
+LANGFUSE_SESSION_ID = os.environ.get("LANGFUSE_SESSION_ID")
+LANGFUSE_USER_ID = (
+    os.environ.get("LANGFUSE_USER_ID") or os.environ.get("USER") or os.environ.get("LOGNAME") or "unknown"
+)
+DEBUG = os.environ.get("LANGFUSE_DEBUG", "").lower() in ("1", "true", "yes")
+LOG_PATH = os.path.join(
+    os.environ.get("CLAUDE_CONFIG_DIR", os.path.expanduser("~/.claude")),
+    "reflex", "langfuse-debug.log"
+)
+
 
 def get_session_id() -> str:
     """Get or generate a session ID for trace grouping."""
     # Use provided session ID or generate from timestamp
-    return os.environ.get(
-        "LANGFUSE_SESSION_ID",
-        f"claude-code-{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}"
-    )
+    if LANGFUSE_SESSION_ID is not None:
+        return LANGFUSE_SESSION_ID
+    return f"claude-code-{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}"
 
 
 def parse_tool_data(data: dict) -> dict:
@@ -53,37 +72,42 @@ def parse_tool_data(data: dict) -> dict:
     }
 
 
+# Debug messages are buffered and written once per run by flush_debug_log()
+_debug_lines = []
+
+
 def debug_log(msg: str) -> None:
-    """Write debug message to log file."""
-    log_path = os.path.join(
-        os.environ.get("CLAUDE_CONFIG_DIR", os.path.expanduser("~/.claude")),
-        "reflex", "langfuse-debug.log"
-    )
-    if os.path.exists(log_path) and os.path.getsize(log_path) > 1_000_000:
-        with open(log_path, "w") as f:
+    """Queue a debug message for the log file (no-op unless LANGFUSE_DEBUG)."""
+    if DEBUG:
+        _debug_lines.append(f"[PYTHON] {msg}\n")
+
+
+def flush_debug_log() -> None:
+    """Append all queued debug messages to the log file in one write."""
+    if not _debug_lines:
+        return
+    if os.path.exists(LOG_PATH) and os.path.getsize(LOG_PATH) > 1_000_000:
+        with open(LOG_PATH, "w") as f:
             pass
-    fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    fd = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
     with open(fd, "a") as f:
-        f.write(f"[PYTHON] {msg}\n")
+        f.write("".join(_debug_lines))
+    _debug_lines.clear()
 
 
 def send_trace(tool_data: dict) -> None:
     """Send tool call trace to LangFuse using SDK v3 API."""
-    host = os.environ.get("LANGFUSE_BASE_URL", "http://localhost:3000")
-    public_key = os.environ.get("LANGFUSE_PUBLIC_KEY")
-    secret_key = os.environ.get("LANGFUSE_SECRET_KEY")
+    debug_log(f"host={LANGFUSE_BASE_URL}")
+    debug_log(f"public_key={'<set>' if LANGFUSE_PUBLIC_KEY else '<not set>'}")
+    debug_log(f"secret_key={'<set>' if LANGFUSE_SECRET_KEY else '<not set>'}")
 
-    debug_log(f"host={host}")
-    debug_log(f"public_key={'<set>' if public_key else '<not set>'}")
-    debug_log(f"secret_key={'<set>' if secret_key else '<not set>'}")
-
-    if not public_key or not secret_key:
+    if not LANGFUSE_PUBLIC_KEY or not LANGFUSE_SECRET_KEY:
         debug_log("Missing credentials, returning")
         return
 
     try:
         # Set environment variables for get_client() to use
-        os.environ["LANGFUSE_HOST"] = host
+        os.environ["LANGFUSE_HOST"] = LANGFUSE_BASE_URL
 
         debug_log("Getting Langfuse client...")
         langfuse = get_client()
@@ -92,11 +116,11 @@ def send_trace(tool_data: dict) -> None:
         parsed = parse_tool_data(tool_data)
         # Prefer LANGFUSE_SESSION_ID env var (set by containers to the container name),
         # then fall back to Claude Code's per-session UUID, then generate one
-        session_id = os.environ.get("LANGFUSE_SESSION_ID") or parsed.get("session_id") or get_session_id()
+        session_id = LANGFUSE_SESSION_ID or parsed.get("session_id") or get_session_id()
 
         # SDK v3 uses start_as_current_observation with context manager
         # Use propagate_attributes for session_id and user_id
-        user_id = os.environ.get("LANGFUSE_USER_ID") or os.environ.get("USER") or os.environ.get("LOGNAME") or "unknown"
+        user_id = LANGFUSE_USER_ID
         debug_log(f"Creating span for tool:{parsed['tool_name']}")
         debug_log(f"user_id={user_id}")
 
@@ -130,18 +154,20 @@ def send_trace(tool_data: dict) -> None:
     except Exception as e:
         # Log error for debugging
         debug_log(f"ERROR: {type(e).__name__}: {e}")
-        import traceback
-        debug_log(f"Traceback: {traceback.format_exc()}")
+        if DEBUG:
+            import traceback
+            debug_log(f"Traceback: {traceback.format_exc()}")
 
 
 def main():
     """Read tool data from stdin and send trace."""
     try:
-        raw_input = sys.stdin.read().strip()
-        if not raw_input:
+        # Parse the raw bytes; no intermediate decoded/stripped str copy
+        raw_input = sys.stdin.buffer.read()
+        if not raw_input or raw_input.isspace():
             return
 
-        tool_data = json.loads(raw_input)
+        tool_data = _json_loads(raw_input)
         send_trace(tool_data)
 
     except json.JSONDecodeError:
@@ -150,6 +176,11 @@ def main():
     except Exception:
         # Any other error - skip silently
         pass
+    finally:
+        try:
+            flush_debug_log()
+        except OSError:
+            pass
 
 
 if __name__ == "__main__":
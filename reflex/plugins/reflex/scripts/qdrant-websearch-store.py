@@ -14,11 +14,17 @@ import os
 import re
 import sys
 import uuid
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib parses bytes too
+    _json_loads = json.loads
+
 
 # =============================================================================
 # Configuration
@@ -79,6 +85,30 @@ FRAMEWORKS = [
     "spring", "rails", "laravel", "asp.net"
 ]
 
+# Query intent indicators, checked in order (first matching type wins)
+QUERY_TYPE_KEYWORDS = {
+    "tutorial": ("how to", "guide", "tutorial", "learn", "getting started"),
+    "troubleshooting": ("error", "fix", "debug", "problem", "issue", "not working", "fails"),
+    "comparison": (" vs ", " versus ", "compare", "difference between", "better than"),
+    "documentation": ("documentation", "docs", "api reference", "specification"),
+}
+
+# Time-sensitive query indicators
+CURRENT_KEYWORDS = ("latest", "new", "2026", "2025", "current", "today", "recent")
+
+# Common words skipped when extracting related topics
+STOP_WORDS = frozenset({
+    "the", "a", "an", "in", "on", "at", "to", "for", "of", "and", "or", "how", "what", "why", "when"
+})
+
+WORD_RE = re.compile(r'\w+')
+
+# Domains that raise confidence in a result set
+REPUTABLE_DOMAINS = frozenset({
+    "github.com", "stackoverflow.com", "docs.python.org", "developer.mozilla.org",
+    "microsoft.com", "aws.amazon.com", "google.com", "wikipedia.org"
+})
+
 
 def extract_domain(url: str) -> Optional[str]:
     """Extract domain from URL."""
@@ -93,14 +123,19 @@ def extract_domain(url: str) -> Optional[str]:
         return None
 
 
-def categorize_by_keywords(text: str) -> Tuple[str, Optional[str]]:
+def categorize_by_keywords(text: str, text_lower: Optional[str] = None) -> Tuple[str, Optional[str]]:
     """
     Categorize query/results using keyword matching.
 
+    Args:
+        text: Text to categorize
+        text_lower: text.lower(), if the caller already has it
+
     Returns:
         (category, subcategory) tuple
     """
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
 
     # Check technology subcategories first
     for subcategory, keywords in TECH_CATEGORIES.items():
@@ -125,38 +160,28 @@ def infer_type_from_query(query: str) -> str:
     """
     query_lower = query.lower()
 
-    # Tutorial indicators
-    if any(word in query_lower for word in ["how to", "guide", "tutorial", "learn", "getting started"]):
-        return "tutorial"
-
-    # Troubleshooting indicators
-    if any(word in query_lower for word in ["error", "fix", "debug", "problem", "issue", "not working", "fails"]):
-        return "troubleshooting"
-
-    # Comparison indicators
-    if any(word in query_lower for word in [" vs ", " versus ", "compare", "difference between", "better than"]):
-        return "comparison"
-
-    # Documentation indicators
-    if any(word in query_lower for word in ["documentation", "docs", "api reference", "specification"]):
-        return "documentation"
+    for content_type, keywords in QUERY_TYPE_KEYWORDS.items():
+        if any(word in query_lower for word in keywords):
+            return content_type
 
     # Default to reference
     return "reference"
 
 
-def extract_language(text: str) -> Optional[str]:
-    """Extract programming language from text."""
-    text_lower = text.lower()
+def extract_language(text: str, text_lower: Optional[str] = None) -> Optional[str]:
+    """Extract programming language from text (text_lower: precomputed text.lower())."""
+    if text_lower is None:
+        text_lower = text.lower()
     for lang in LANGUAGES:
         if lang in text_lower:
             return lang
     return None
 
 
-def extract_framework(text: str) -> Optional[str]:
-    """Extract framework from text."""
-    text_lower = text.lower()
+def extract_framework(text: str, text_lower: Optional[str] = None) -> Optional[str]:
+    """Extract framework from text (text_lower: precomputed text.lower())."""
+    if text_lower is None:
+        text_lower = text.lower()
     for fw in FRAMEWORKS:
         if fw in text_lower:
             return fw
@@ -170,26 +195,15 @@ def extract_related_topics(query: str, results: List[Dict]) -> List[str]:
     Returns:
         List of topic keywords (max 5)
     """
-    # Extract significant words from query (skip common words)
-    stop_words = {"the", "a", "an", "in", "on", "at", "to", "for", "of", "and", "or", "how", "what", "why", "when"}
-    query_words = [w.lower() for w in re.findall(r'\w+', query) if w.lower() not in stop_words]
-
-    # Extract words from result titles
-    title_words = []
-    for result in results[:3]:  # Only top 3 results
-        title = result.get("title", "")
-        title_words.extend([w.lower() for w in re.findall(r'\w+', title) if w.lower() not in stop_words])
-
-    # Combine and deduplicate
-    all_words = query_words + title_words
-    word_freq = {}
-    for word in all_words:
-        if len(word) > 3:  # Skip short words
-            word_freq[word] = word_freq.get(word, 0) + 1
+    # Query words first, then words from the top 3 result titles,
+    # lowercased once; skip short and common words
+    text = " ".join([query] + [r.get("title", "") for r in results[:3]]).lower()
+    word_freq = Counter(
+        w for w in WORD_RE.findall(text) if len(w) > 3 and w not in STOP_WORDS
+    )
 
-    # Return top 5 most frequent
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    return [word for word, _ in sorted_words[:5]]
+    # Return top 5 most frequent (ties keep first-seen order)
+    return [word for word, _ in word_freq.most_common(5)]
 
 
 def calculate_confidence(results: List[Dict]) -> str:
@@ -199,25 +213,16 @@ def calculate_confidence(results: List[Dict]) -> str:
     Returns:
         One of: high, medium, low
     """
-    if not results:
-        return "low"
-
-    # Check for reputable domains
-    reputable_domains = {
-        "github.com", "stackoverflow.com", "docs.python.org", "developer.mozilla.org",
-        "microsoft.com", "aws.amazon.com", "google.com", "wikipedia.org"
-    }
-
-    reputable_count = 0
-    for result in results[:5]:
-        url = result.get("url", "")
-        domain = extract_domain(url)
-        if domain in reputable_domains:
-            reputable_count += 1
-
     # Confidence based on reputable sources and result count
-    if len(results) >= 5 and reputable_count >= 2:
-        return "high"
+    if len(results) >= 5:
+        # High needs 2 reputable domains among the top 5; stop once found
+        reputable_count = 0
+        for result in results[:5]:
+            if extract_domain(result.get("url", "")) in REPUTABLE_DOMAINS:
+                reputable_count += 1
+                if reputable_count >= 2:
+                    return "high"
+        return "medium"
     elif len(results) >= 3:
         return "medium"
     else:
@@ -234,7 +239,7 @@ def infer_freshness(query: str) -> str:
     query_lower = query.lower()
 
     # Time-sensitive indicators
-    if any(word in query_lower for word in ["latest", "new", "2026", "2025", "current", "today", "recent"]):
+    if any(word in query_lower for word in CURRENT_KEYWORDS):
         return "current"
 
     # General queries (assume recent)
@@ -254,7 +259,9 @@ def build_metadata(tool_input: Dict, tool_response: List[Dict]) -> Dict:
 
     # Categorize
     combined_text = query + " " + " ".join([r.get("title", "") + " " + r.get("snippet", "") for r in results[:3]])
-    category, subcategory = categorize_by_keywords(combined_text)
+    # Lowercase once for all the keyword scans below
+    combined_lower = combined_text.lower()
+    category, subcategory = categorize_by_keywords(combined_text, combined_lower)
 
     # Build metadata
     metadata = {
@@ -285,11 +292,11 @@ def build_metadata(tool_input: Dict, tool_response: List[Dict]) -> Dict:
     if subcategory:
         metadata["subcategory"] = subcategory
 
-    language = extract_language(combined_text)
+    language = extract_language(combined_text, combined_lower)
     if language:
         metadata["language"] = language
 
-    framework = extract_framework(combined_text)
+    framework = extract_framework(combined_text, combined_lower)
     if framework:
         metadata["framework"] = framework
 
@@ -364,8 +371,7 @@ def store_to_qdrant(content: str, metadata: Dict) -> None:
         client = QdrantClient(url=QDRANT_URL, timeout=5)
 
         # Ensure collection exists
-        collections = [c.name for c in client.get_collections().collections]
-        if COLLECTION_NAME not in collections:
+        if not client.collection_exists(COLLECTION_NAME):
             client.create_collection(
                 collection_name=COLLECTION_NAME,
                 vectors_config={
@@ -447,8 +453,8 @@ def parse_tool_response(tool_response) -> List[Dict]:
 def main():
     """Main entry point for hook script."""
     try:
-        # Read tool data from stdin
-        tool_data = json.loads(sys.stdin.read())
+        # Read tool data from stdin (parsed as raw bytes, no decoded str copy)
+        tool_data = _json_loads(sys.stdin.buffer.read())
 
         # Extract tool input and response
         tool_input = tool_data.get("tool_input", {})
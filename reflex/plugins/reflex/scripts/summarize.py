@@ -15,27 +15,34 @@ Usage:
     # Anthropic
     uvx --with anthropic python summarize.py transcript.vtt --llm anthropic
 
-    # DOCX input (needs python-docx)
-    uvx --with python-docx python summarize.py meeting.docx
+    # DOCX input
+    python summarize.py meeting.docx
 
     # Custom model and output
     python summarize.py notes.txt --llm ollama --model mistral --output summary.md
 
+    # Long transcripts: summarize chunks concurrently
+    uvx --with openai python summarize.py all-hands.vtt --llm openai --parallel 4
+
 Environment variables (REFLEX_TRANSCRIPT_ prefix):
     REFLEX_TRANSCRIPT_LLM     LLM provider (default: ollama)
     REFLEX_TRANSCRIPT_MODEL   Model name override
 """
 
 import argparse
+import http.client
 import json
 import os
 import re
 import sys
-import urllib.error
-import urllib.request
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date as date_module
 from pathlib import Path
-from typing import Protocol
+from typing import Iterator, Protocol
+from urllib.parse import urlsplit
 
 
 # =============================================================================
@@ -45,6 +52,29 @@ from typing import Protocol
 WORD_THRESHOLD = 30_000
 CHUNK_TARGET_WORDS = 20_000
 
+# Caption/transcript patterns, compiled once for the per-line parser loops
+TAG_RE = re.compile(r"<[^>]+>")
+SPEAKER_BRACKET_RE = re.compile(r"\[([^\]]+)\](\s*)")
+SPEAKER_LABEL_RE = re.compile(r"SPEAKER_(\d+)")
+PARAGRAPH_BREAK_RE = re.compile(r"\n\s*\n")
+
+# WordprocessingML tags read by parse_docx
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_P = f"{W_NS}p"
+W_R = f"{W_NS}r"
+W_T = f"{W_NS}t"
+W_BR = f"{W_NS}br"
+W_TYPE = f"{W_NS}type"
+W_HYPERLINK = f"{W_NS}hyperlink"
+
+# Run content other than <w:t>/<w:br> and its plain-text equivalent
+DOCX_RUN_TEXT = {
+    f"{W_NS}tab": "\t",
+    f"{W_NS}ptab": "\t",
+    f"{W_NS}cr": "\n",
+    f"{W_NS}noBreakHyphen": "-",
+}
+
 DEFAULT_MODELS = {
     "ollama": "llama3.2",
     "openai": "gpt-4o-mini",
@@ -162,17 +192,20 @@ class DependencyError(SummarizeError):
 # Transcript Parsers
 # =============================================================================
 
-def parse_vtt(text: str) -> str:
-    """Parse WebVTT captions into clean text.
+def is_vtt_timestamp(line: str) -> bool:
+    """Return True if the line starts like a cue timestamp (e.g. "00:01:02.000")."""
+    return (
+        len(line) >= 6
+        and line[:2].isdecimal()
+        and line[2] == ":"
+        and line[3:5].isdecimal()
+        and line[5] in ":."
+    )
 
-    Strips WEBVTT header, timestamps, positioning tags, and deduplicates
-    rolling captions (where the same line appears with shifting timestamps).
-    """
-    lines = text.splitlines()
-    result = []
-    seen = set()
 
-    for line in lines:
+def iter_vtt_lines(text: str) -> Iterator[str]:
+    """Yield the caption text lines of a WebVTT file, tags stripped."""
+    for line in text.splitlines():
         stripped = line.strip()
         # Skip header, blank lines, timestamp lines, NOTE blocks
         if not stripped:
@@ -181,75 +214,127 @@ def parse_vtt(text: str) -> str:
             continue
         if stripped.startswith("NOTE"):
             continue
-        if re.match(r"^\d{2}:\d{2}[:\.]", stripped):
-            continue
         if "-->" in stripped:
             continue
-        # Strip VTT tags like <c>, </c>, <v Name>, etc
-        cleaned = re.sub(r"<[^>]+>", "", stripped)
-        cleaned = cleaned.strip()
-        if not cleaned:
+        if is_vtt_timestamp(stripped):
             continue
-        # Deduplicate rolling captions
-        if cleaned not in seen:
-            seen.add(cleaned)
-            result.append(cleaned)
-
-    return "\n".join(result)
+        # Strip VTT tags like <c>, </c>, <v Name>, etc
+        cleaned = TAG_RE.sub("", stripped).strip() if "<" in stripped else stripped
+        if cleaned:
+            yield cleaned
 
 
-def parse_srt(text: str) -> str:
-    """Parse SRT subtitles into clean text.
+def parse_vtt(text: str) -> str:
+    """Parse WebVTT captions into clean text.
 
-    Strips sequence numbers, timestamps, and blank separator lines.
+    Strips WEBVTT header, timestamps, positioning tags, and deduplicates
+    rolling captions (where the same line appears with shifting timestamps).
     """
-    lines = text.splitlines()
-    result = []
-    seen = set()
+    # Deduplicate rolling captions, keeping first occurrences in order
+    return "\n".join(dict.fromkeys(iter_vtt_lines(text)))
 
-    for line in lines:
+
+def iter_srt_lines(text: str) -> Iterator[str]:
+    """Yield the subtitle text lines of an SRT file, tags stripped."""
+    for line in text.splitlines():
         stripped = line.strip()
         if not stripped:
             continue
-        # Skip sequence numbers (standalone integers)
-        if re.match(r"^\d+$", stripped):
-            continue
         # Skip timestamp lines
         if "-->" in stripped:
             continue
-        # Strip HTML-like tags sometimes in SRT
-        cleaned = re.sub(r"<[^>]+>", "", stripped).strip()
-        if not cleaned:
+        # Skip sequence numbers (standalone integers)
+        if stripped.isdecimal():
             continue
-        if cleaned not in seen:
-            seen.add(cleaned)
-            result.append(cleaned)
+        # Strip HTML-like tags sometimes in SRT
+        cleaned = TAG_RE.sub("", stripped).strip() if "<" in stripped else stripped
+        if cleaned:
+            yield cleaned
+
+
+def parse_srt(text: str) -> str:
+    """Parse SRT subtitles into clean text.
+
+    Strips sequence numbers, timestamps, and blank separator lines.
+    """
+    return "\n".join(dict.fromkeys(iter_srt_lines(text)))
+
+
+def docx_document_path(zf: zipfile.ZipFile) -> str:
+    """Return the main document part named in the package relationships."""
+    with zf.open("_rels/.rels") as f:
+        for rel in ET.parse(f).getroot():
+            if rel.get("Type", "").endswith("/officeDocument"):
+                return rel.get("Target", "").lstrip("/")
+    return "word/document.xml"
+
+
+def docx_run_text(run: ET.Element) -> str:
+    """Plain text of a <w:r> run: text, tabs, line breaks and hyphens."""
+    parts = []
+    for el in run:
+        if el.tag == W_T:
+            parts.append(el.text or "")
+        elif el.tag == W_BR:
+            # Page and column breaks carry no text
+            if el.get(W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(DOCX_RUN_TEXT.get(el.tag, ""))
+    return "".join(parts)
 
-    return "\n".join(result)
+
+def iter_docx_paragraphs(path: str) -> Iterator[str]:
+    """Stream the text of each top-level paragraph in a DOCX body.
+
+    Parses word/document.xml incrementally and clears each body element once
+    read, so memory stays bounded by one paragraph or table.
+    """
+    with zipfile.ZipFile(path) as zf, zf.open(docx_document_path(zf)) as f:
+        depth = 0
+        for event, el in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            # Children of <w:body> sit at depth 2 (<w:document> is depth 0)
+            if depth != 2:
+                continue
+            if el.tag == W_P:
+                parts = []
+                for child in el:
+                    if child.tag == W_R:
+                        parts.append(docx_run_text(child))
+                    elif child.tag == W_HYPERLINK:
+                        parts.extend(docx_run_text(r) for r in child.findall(W_R))
+                yield "".join(parts)
+            el.clear()
 
 
 def parse_docx(path: str) -> str:
-    """Extract text from a DOCX file using python-docx."""
+    """Extract paragraph text from a DOCX file (stdlib zipfile + XML)."""
     try:
-        from docx import Document
-    except ImportError:
-        raise DependencyError(
-            "python-docx is required for DOCX files. "
-            "Run with: uvx --with python-docx python summarize.py ..."
-        )
-
-    doc = Document(path)
-    paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
+        paragraphs = [t for t in iter_docx_paragraphs(path) if t.strip()]
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        raise TranscriptParseError(f"Could not read DOCX {path}: {e}")
     return "\n\n".join(paragraphs)
 
 
+def format_speaker_label(m: re.Match) -> str:
+    """Replacement for SPEAKER_LABEL_RE: SPEAKER_01 -> Speaker 1:"""
+    return f"Speaker {int(m.group(1))}:"
+
+
 def parse_txt(text: str) -> str:
     """Pass-through for plain text. Normalizes whitespace."""
-    # Normalize various speaker label formats
+    # Normalize various speaker label formats, skipping the regex scan when
+    # the marker can't occur
     # [Speaker Name] -> Speaker Name:
-    text = re.sub(r"\[([^\]]+)\](\s*)", r"\1:\2", text)
+    if "[" in text:
+        text = SPEAKER_BRACKET_RE.sub(r"\1:\2", text)
     # SPEAKER_01 -> Speaker 1:
-    text = re.sub(r"SPEAKER_(\d+)", lambda m: f"Speaker {int(m.group(1))}:", text)
+    if "SPEAKER_" in text:
+        text = SPEAKER_LABEL_RE.sub(format_speaker_label, text)
     return text.strip()
 
 
@@ -264,13 +349,18 @@ def load_transcript(path: str) -> str:
     if suffix == ".docx":
         return parse_docx(path)
 
+    # Read once; fall back to latin-1 (which accepts any byte) on bad UTF-8
     try:
-        text = p.read_text(encoding="utf-8")
+        data = p.read_bytes()
+    except OSError as e:
+        raise TranscriptParseError(f"Could not read {path}: {e}")
+    try:
+        text = data.decode("utf-8")
     except UnicodeDecodeError:
-        try:
-            text = p.read_text(encoding="latin-1")
-        except Exception as e:
-            raise TranscriptParseError(f"Could not read {path}: {e}")
+        text = data.decode("latin-1")
+    # Match text-mode reads: universal newlines
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     if suffix == ".vtt":
         return parse_vtt(text)
@@ -294,14 +384,47 @@ class LLMProvider(Protocol):
 
 
 class OllamaProvider:
-    """Ollama provider using stdlib urllib (zero external deps)."""
+    """Ollama provider using stdlib http.client (zero external deps).
+
+    Keeps one keep-alive connection open per thread so multi-chunk summaries
+    don't reconnect for every request.
+    """
 
     def __init__(self, model: str, base_url: str = "http://localhost:11434"):
         self.model = model
         self.base_url = base_url.rstrip("/")
+        parts = urlsplit(self.base_url)
+        self._netloc = parts.netloc
+        self._https = parts.scheme == "https"
+        self._chat_path = f"{parts.path}/api/chat"
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """Return this thread's connection to Ollama, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._https:
+                conn = http.client.HTTPSConnection(self._netloc, timeout=300)
+            else:
+                conn = http.client.HTTPConnection(self._netloc, timeout=300)
+            self._local.conn = conn
+        return conn
+
+    def _post(self, data: bytes) -> tuple[int, bytes]:
+        """POST a chat request and return (status, body)."""
+        conn = self._connection()
+        headers = {"Content-Type": "application/json"}
+        try:
+            conn.request("POST", self._chat_path, body=data, headers=headers)
+            resp = conn.getresponse()
+        except (ConnectionResetError, BrokenPipeError):
+            # Ollama dropped the idle keep-alive connection; reconnect once
+            conn.close()
+            conn.request("POST", self._chat_path, body=data, headers=headers)
+            resp = conn.getresponse()
+        return resp.status, resp.read()
 
     def complete(self, system: str, user: str) -> str:
-        url = f"{self.base_url}/api/chat"
         payload = {
             "model": self.model,
             "messages": [
@@ -311,20 +434,23 @@ class OllamaProvider:
             "stream": False,
         }
         data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-        )
 
         try:
-            with urllib.request.urlopen(req, timeout=300) as resp:
-                body = json.loads(resp.read().decode("utf-8"))
-        except urllib.error.URLError as e:
+            status, raw = self._post(data)
+        except (OSError, http.client.HTTPException) as e:
+            self._connection().close()
             raise LLMConnectionError(
                 f"Could not connect to Ollama at {self.base_url}. "
                 f"Is Ollama running? Error: {e}"
             )
+        if status >= 400:
+            raise LLMConnectionError(
+                f"Ollama at {self.base_url} returned HTTP {status}: "
+                f"{raw.decode('utf-8', errors='replace')}"
+            )
+
+        try:
+            body = json.loads(raw)
         except json.JSONDecodeError as e:
             raise LLMResponseError(f"Invalid JSON from Ollama: {e}")
 
@@ -391,23 +517,27 @@ class AnthropicProvider:
             raise LLMConnectionError(f"Anthropic API error: {e}")
 
 
+def create_ollama_provider(model: str) -> OllamaProvider:
+    """Create an Ollama provider for OLLAMA_HOST (default: localhost)."""
+    base_url = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+    return OllamaProvider(model=model, base_url=base_url)
+
+
+PROVIDER_FACTORIES = {
+    "ollama": create_ollama_provider,
+    "openai": OpenAIProvider,
+    "anthropic": AnthropicProvider,
+}
+
+
 def create_provider(name: str, model: str | None = None) -> LLMProvider:
     """Factory to create an LLM provider by name."""
-    resolved_model = model or DEFAULT_MODELS.get(name)
-    if not resolved_model:
-        raise SummarizeError(f"Unknown provider: {name}")
-
-    if name == "ollama":
-        base_url = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
-        return OllamaProvider(model=resolved_model, base_url=base_url)
-    elif name == "openai":
-        return OpenAIProvider(model=resolved_model)
-    elif name == "anthropic":
-        return AnthropicProvider(model=resolved_model)
-    else:
+    factory = PROVIDER_FACTORIES.get(name)
+    if factory is None:
         raise SummarizeError(
-            f"Unknown provider '{name}'. Supported: ollama, openai, anthropic"
+            f"Unknown provider '{name}'. Supported: {', '.join(PROVIDER_FACTORIES)}"
         )
+    return factory(model=model or DEFAULT_MODELS[name])
 
 
 # =============================================================================
@@ -419,7 +549,18 @@ def word_count(text: str) -> int:
     return len(text.split())
 
 
-def chunk_transcript(text: str, target_words: int = CHUNK_TARGET_WORDS) -> list[str]:
+def iter_paragraphs(text: str) -> Iterator[str]:
+    """Yield the paragraphs of text (split on blank lines) one at a time."""
+    pos = 0
+    for m in PARAGRAPH_BREAK_RE.finditer(text):
+        yield text[pos:m.start()]
+        pos = m.end()
+    yield text[pos:]
+
+
+def chunk_transcript(
+    text: str, target_words: int = CHUNK_TARGET_WORDS
+) -> tuple[list[str], int]:
     """Split transcript into chunks at natural boundaries.
 
     Prefers splitting at:
@@ -428,14 +569,17 @@ def chunk_transcript(text: str, target_words: int = CHUNK_TARGET_WORDS) -> list[
     3. Single newlines
 
     Each chunk targets ~target_words but won't split mid-sentence.
+
+    Returns the chunks and the total word count of the transcript.
     """
-    paragraphs = re.split(r"\n\s*\n", text)
     chunks: list[str] = []
     current: list[str] = []
     current_words = 0
+    total_words = 0
 
-    for para in paragraphs:
+    for para in iter_paragraphs(text):
         para_words = word_count(para)
+        total_words += para_words
 
         if current_words + para_words > target_words and current:
             chunks.append("\n\n".join(current))
@@ -448,7 +592,7 @@ def chunk_transcript(text: str, target_words: int = CHUNK_TARGET_WORDS) -> list[
     if current:
         chunks.append("\n\n".join(current))
 
-    return chunks
+    return chunks, total_words
 
 
 def summarize_single(
@@ -468,18 +612,22 @@ def summarize_single(
 
 def summarize_multi(
     provider: LLMProvider,
-    transcript: str,
+    chunks: list[str],
     title: str,
     meeting_date: str,
+    parallel: int = 1,
 ) -> str:
-    """Two-pass chunked summarization for long transcripts."""
-    chunks = chunk_transcript(transcript)
+    """Two-pass chunked summarization for long transcripts.
+
+    Takes the chunks produced by chunk_transcript. Pass 1 extracts up to
+    ``parallel`` chunks concurrently; chunk order is preserved for the
+    synthesis pass.
+    """
     total = len(chunks)
     eprint(f"Transcript split into {total} chunks for processing")
 
     # Pass 1: Extract from each chunk
-    chunk_summaries: list[str] = []
-    for i, chunk in enumerate(chunks, 1):
+    def extract_chunk(i: int, chunk: str) -> str:
         eprint(f"Processing chunk {i}/{total}...")
         extract_prompt = CHUNK_EXTRACT_PROMPT.format(
             chunk_num=i, total_chunks=total
@@ -490,7 +638,15 @@ def summarize_multi(
             f"Transcript chunk {i}/{total}:\n\n{chunk}"
         )
         summary = provider.complete(extract_prompt, user_msg)
-        chunk_summaries.append(f"### Chunk {i}/{total}\n\n{summary}")
+        return f"### Chunk {i}/{total}\n\n{summary}"
+
+    with ThreadPoolExecutor(max_workers=min(parallel, total)) as pool:
+        try:
+            chunk_summaries = list(pool.map(extract_chunk, range(1, total + 1), chunks))
+        except BaseException:
+            # Don't start the remaining chunks once one has failed
+            pool.shutdown(cancel_futures=True)
+            raise
 
     # Pass 2: Synthesize
     eprint("Synthesizing final summary...")
@@ -506,14 +662,15 @@ def summarize(
     transcript: str,
     title: str,
     meeting_date: str,
+    parallel: int = 1,
 ) -> str:
     """Route to single-pass or multi-pass based on transcript length."""
-    wc = word_count(transcript)
+    chunks, wc = chunk_transcript(transcript)
     eprint(f"Transcript: {wc:,} words")
 
     if wc > WORD_THRESHOLD:
         eprint(f"Long transcript (>{WORD_THRESHOLD:,} words), using chunked processing")
-        return summarize_multi(provider, transcript, title, meeting_date)
+        return summarize_multi(provider, chunks, title, meeting_date, parallel)
     else:
         eprint("Using single-pass summarization")
         return summarize_single(provider, transcript, title, meeting_date)
@@ -542,6 +699,7 @@ examples:
   python summarize.py meeting.srt --llm openai --model gpt-4o
   python summarize.py notes.txt --llm anthropic --title "Sprint Planning"
   python summarize.py meeting.docx --output summary.md
+  python summarize.py all-hands.vtt --llm openai --parallel 4
         """,
     )
     parser.add_argument(
@@ -550,7 +708,7 @@ examples:
     )
     parser.add_argument(
         "--llm",
-        choices=["ollama", "openai", "anthropic"],
+        choices=list(PROVIDER_FACTORIES),
         default=None,
         help="LLM provider (default: REFLEX_TRANSCRIPT_LLM env or 'ollama')",
     )
@@ -574,8 +732,16 @@ examples:
         default="stdout",
         help="Output path or 'stdout' (default: stdout)",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Chunks to summarize concurrently for long transcripts (default: 1)",
+    )
 
     args = parser.parse_args()
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
 
     # Resolve LLM provider: flag > env > default
     llm_name = args.llm or os.environ.get("REFLEX_TRANSCRIPT_LLM", "ollama")
@@ -611,7 +777,7 @@ examples:
 
     # Summarize
     try:
-        result = summarize(provider, transcript, title, meeting_date)
+        result = summarize(provider, transcript, title, meeting_date, args.parallel)
     except SummarizeError as e:
         eprint(f"Error during summarization: {e}")
         sys.exit(1)
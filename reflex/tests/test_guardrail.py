@@ -0,0 +1,181 @@
+"""Tests for the guardrail hook's pattern matching."""
+
+from __future__ import annotations
+
+import importlib.util
+import io
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "plugins" / "reflex" / "scripts"
+SCRIPT = SCRIPTS_DIR / "guardrail.py"
+
+_spec = importlib.util.spec_from_file_location("guardrail", SCRIPT)
+guardrail = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(guardrail)
+
+
+@pytest.fixture()
+def user_config(tmp_path, monkeypatch):
+    """Point CLAUDE_CONFIG_DIR at a temp dir; returns a guardrail-config.json writer."""
+    monkeypatch.setenv("CLAUDE_CONFIG_DIR", str(tmp_path))
+    reflex_dir = tmp_path / "reflex"
+    reflex_dir.mkdir()
+
+    def write(config: dict) -> None:
+        (reflex_dir / "guardrail-config.json").write_text(json.dumps(config))
+
+    return write
+
+
+# ---------------------------------------------------------------------------
+# match_patterns
+# ---------------------------------------------------------------------------
+
+
+class TestMatchPatterns:
+    def test_benign_command_matches_nothing(self, user_config):
+        patterns = guardrail.load_patterns()
+        assert guardrail.match_patterns("Bash", {"command": "ls -la"}, patterns) == []
+
+    def test_user_pattern_with_backreference_alongside_defaults(self, user_config):
+        user_config(
+            {
+                "additional_patterns": [
+                    {
+                        "name": "repeated_rm",
+                        "severity": "critical",
+                        "category": "custom",
+                        "pattern": r"(rm)\s+\1",
+                        "description": "Repeated rm",
+                        "tool": "Bash",
+                        "field": "command",
+                    }
+                ],
+            }
+        )
+        patterns = guardrail.load_patterns()
+
+        matches = guardrail.match_patterns("Bash", {"command": "rm rm"}, patterns)
+
+        assert [m.pattern.name for m in matches] == ["repeated_rm"]
+        decision, match = guardrail.determine_decision(matches)
+        assert decision == guardrail.Decision.DENY
+        assert match.matched_text == "rm rm"
+
+    def test_named_group_patterns_match_individually(self):
+        patterns = [
+            guardrail.Pattern(
+                name=name,
+                severity=guardrail.Severity.HIGH,
+                category="custom",
+                pattern=regex,
+                description=name,
+                tool="Bash",
+                field="command",
+            )
+            for name, regex in [
+                ("named", r"(?P<verb>drop)\s+(?P=verb)"),
+                ("plain", r"truncate"),
+            ]
+        ]
+
+        matches = guardrail.match_patterns("Bash", {"command": "drop drop"}, patterns)
+
+        assert [m.pattern.name for m in matches] == ["named"]
+
+
+# ---------------------------------------------------------------------------
+# Catastrophic backtracking
+# ---------------------------------------------------------------------------
+
+# Command heads that get the default patterns past their literal prefix, so
+# the padding is fed to the quantified parts of each regex
+PADDED_PREFIXES = [
+    "",
+    "git push -f ",
+    "git push --force origin ",
+    "git reset --hard ",
+    "rm -rf ",
+    "mkfs.ext4 ",
+    "DROP ",
+    "kubectl delete ",
+    "curl -X DELETE ",
+]
+PADDING_SIZE = 64 * 1024
+MAX_SEARCH_SECONDS = 0.25
+
+
+@pytest.mark.parametrize("spec", guardrail.DEFAULT_PATTERNS, ids=lambda p: p["name"])
+@pytest.mark.parametrize("pad", [" ", "A"], ids=["whitespace", "A"])
+def test_default_pattern_is_linear_on_padded_input(spec, pad):
+    pattern = guardrail.Pattern(**{**spec, "severity": guardrail.Severity(spec["severity"])})
+    for prefix in PADDED_PREFIXES:
+        command = prefix + pad * PADDING_SIZE + "x"
+
+        start = time.perf_counter()
+        pattern.compiled.search(command)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < MAX_SEARCH_SECONDS, f"{prefix!r} + {pad!r} padding took {elapsed:.2f}s"
+
+
+# ---------------------------------------------------------------------------
+# format_output
+# ---------------------------------------------------------------------------
+
+
+class TestFormatOutput:
+    def test_allow_is_silent(self):
+        assert guardrail.format_output(guardrail.Decision.ALLOW, None) == ""
+
+    def test_deny_is_valid_json(self, user_config):
+        patterns = guardrail.load_patterns()
+        matches = guardrail.match_patterns("Bash", {"command": 'rm -rf / # "quoted"'}, patterns)
+        decision, match = guardrail.determine_decision(matches)
+
+        output = json.loads(guardrail.format_output(decision, match))
+
+        assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
+        assert output["systemMessage"].startswith("[BLOCKED]")
+
+
+# ---------------------------------------------------------------------------
+# main
+# ---------------------------------------------------------------------------
+
+
+class TestMain:
+    @pytest.fixture()
+    def stdin(self, monkeypatch):
+        def feed(data: dict) -> None:
+            raw = io.BytesIO(json.dumps(data).encode())
+            monkeypatch.setattr(guardrail.sys, "stdin", io.TextIOWrapper(raw))
+
+        return feed
+
+    def run_main(self, capsys) -> str:
+        with pytest.raises(SystemExit) as exc:
+            guardrail.main()
+        assert exc.value.code == 0
+        return capsys.readouterr().out
+
+    def test_denies_when_select_cannot_watch_stdin(self, user_config, stdin, monkeypatch, capsys):
+        # Windows select() rejects pipes; the hook must still read and decide
+        def _no_select(*args):
+            raise OSError("not a socket")
+
+        monkeypatch.setattr(guardrail.select, "select", _no_select)
+        stdin({"tool_name": "Bash", "tool_input": {"command": "rm -rf /"}})
+
+        output = json.loads(self.run_main(capsys))
+
+        assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    def test_allows_when_no_input_arrives(self, user_config, monkeypatch, capsys):
+        monkeypatch.setattr(guardrail.select, "select", lambda *args: ([], [], []))
+
+        assert self.run_main(capsys) == ""